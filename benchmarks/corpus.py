@@ -0,0 +1,70 @@
+"""Deterministic synthetic Kazakh corpora built from the bundled word lists."""
+
+from __future__ import annotations
+
+import random
+from typing import List, Tuple
+
+from qaznltk import get_lexicon
+
+SIZES = {"small": 200, "medium": 2_000, "large": 20_000}
+
+_SUFFIXES = ("", "", "", "лар", "дың", "ға", "да", "мен", "ның", "ге", "ы", "і")
+_PUNCTUATION = (".", ".", ".", "!", "?")
+
+
+def _vocabulary() -> Tuple[List[str], List[str]]:
+    # sorted, so the corpus does not depend on set iteration order (PYTHONHASHSEED)
+    content = sorted(get_lexicon("positive_words") | get_lexicon("negative_words"))
+    stop = sorted(get_lexicon("stop_words"))
+    return content, stop
+
+
+def documents(count: int, seed: int = 0, min_words: int = 6, max_words: int = 40) -> List[str]:
+    """Return ``count`` documents of one to a few sentences each."""
+    rng = random.Random(seed)
+    content, stop = _vocabulary()
+    result = []
+    for _ in range(count):
+        sentences = []
+        remaining = rng.randint(min_words, max_words)
+        while remaining > 0:
+            length = min(remaining, rng.randint(4, 14))
+            remaining -= length
+            words = [
+                rng.choice(stop) if rng.random() < 0.35 else rng.choice(content) + rng.choice(_SUFFIXES)
+                for _ in range(length)
+            ]
+            words[0] = words[0].capitalize()
+            sentences.append(" ".join(words) + rng.choice(_PUNCTUATION))
+        result.append(" ".join(sentences))
+    return result
+
+
+def perturb(text: str, rng: random.Random, rate: float = 0.15) -> str:
+    """Simulate a noisy hypothesis: drop, duplicate or misspell words at ``rate``."""
+    words = []
+    for word in text.split():
+        roll = rng.random()
+        if roll < rate / 3:
+            continue
+        if roll < 2 * rate / 3:
+            words.extend((word, word))
+        elif roll < rate and len(word) > 2:
+            i = rng.randrange(len(word) - 1)
+            words.append(word[:i] + word[i + 1] + word[i] + word[i + 2 :])
+        else:
+            words.append(word)
+    return " ".join(words)
+
+
+def pairs(count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """Return ``(reference, hypothesis)`` pairs for metric benchmarks."""
+    rng = random.Random(seed + 1)
+    return [(text, perturb(text, rng)) for text in documents(count, seed, max_words=20)]
+
+
+def numbers(count: int, seed: int = 0) -> List[int]:
+    """Return integers spread over every magnitude ``num2word`` supports."""
+    rng = random.Random(seed)
+    return [rng.randrange(10 ** rng.randint(1, 31)) for _ in range(count)]
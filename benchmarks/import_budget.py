@@ -0,0 +1,50 @@
+"""Check the cold-start cost of ``import qaznltk``.
+
+    python benchmarks/import_budget.py               # default budget: 60 ms
+    python benchmarks/import_budget.py --budget 100
+
+Fails (exit 1) when a cold import in a fresh interpreter takes longer than
+the budget, or when importing the package already reads the bundled word
+lists, which must only be loaded on first use.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Optional, Sequence
+
+from run import SRC, measure_import
+
+DEFAULT_BUDGET_MS = 60.0
+
+_LAZY_LEXICONS = "import sys, qaznltk, qaznltk.lexicons as lexicons; sys.exit(1 if lexicons._loaded else 0)"
+
+
+def lexicons_are_lazy() -> bool:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run([sys.executable, "-c", _LAZY_LEXICONS], env=env).returncode == 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fail if importing qaznltk is too slow.")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="allowed import time in ms")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters to take the best of")
+    args = parser.parse_args(argv)
+
+    failures = []
+    import_ms = measure_import(args.runs)["import_ms"]
+    print(f"import qaznltk: {import_ms:.1f} ms (budget {args.budget:g} ms)")
+    if import_ms > args.budget:
+        failures.append(f"import took {import_ms:.1f} ms > {args.budget:g} ms")
+    if not lexicons_are_lazy():
+        failures.append("import qaznltk loaded the bundled word lists")
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
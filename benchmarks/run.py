@@ -0,0 +1,305 @@
+"""Benchmark the qaznltk hot paths on synthetic corpora.
+
+    python benchmarks/run.py                             # small and medium corpora
+    python benchmarks/run.py --sizes large -k tokenize   # one size, matching benchmarks only
+    python benchmarks/run.py --save baseline.json        # store results as a baseline
+    python benchmarks/run.py --compare baseline.json     # exit 1 on regressions
+    python benchmarks/run.py --import-budget 60          # exit 1 if a cold import takes longer
+
+Every benchmark reports throughput (items per second, best of ``--repeat``
+runs), per-call latency percentiles and peak traced memory of one run.
+The working tree under ``src`` is measured, not an installed copy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(os.path.dirname(HERE), "src")
+sys.path[:0] = [SRC, HERE]
+
+import corpus  # noqa: E402
+import qaznltk  # noqa: E402
+from qaznltk import (  # noqa: E402
+    KNN,
+    BM25Retriever,
+    QazNLTKVectorizer,
+    bleu_score,
+    calc_wer,
+    convert2cyrillic_iso9,
+    convert2latin_iso9,
+)
+from qaznltk.utils import levenshtein_distance  # noqa: E402
+
+
+class Case(NamedTuple):
+    """``func`` is called once per input; ``items`` is what throughput is counted in."""
+
+    func: Callable[[Any], Any]
+    inputs: Sequence[Any]
+    items: int
+
+
+BENCHMARKS: Dict[str, Callable[[int], Case]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    def register(setup: Callable[[int], Case]) -> Callable[[int], Case]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _per_item(func: Callable[[Any], Any], inputs: Sequence[Any]) -> Case:
+    return Case(func, inputs, len(inputs))
+
+
+@benchmark("levenshtein_distance")
+def _levenshtein(size: int) -> Case:
+    return _per_item(lambda pair: levenshtein_distance(*pair), corpus.pairs(size))
+
+
+@benchmark("tokenize")
+def _tokenize(size: int) -> Case:
+    return _per_item(qaznltk.QazNLTK().tokenize, corpus.documents(size))
+
+
+@benchmark("sentimize")
+def _sentimize(size: int) -> Case:
+    return _per_item(qaznltk.QazNLTK().sentimize, corpus.documents(size))
+
+
+@benchmark("sentimize_batch")
+def _sentimize_batch(size: int) -> Case:
+    qn = qaznltk.QazNLTK()
+    return Case(lambda texts: sum(1 for _ in qn.sentimize_batch(texts)), [corpus.documents(size)], size)
+
+
+@benchmark("calc_similarity")
+def _calc_similarity(size: int) -> Case:
+    return _per_item(lambda pair: qaznltk.calc_similarity(*pair), corpus.pairs(size))
+
+
+@benchmark("fit_transform")
+def _fit_transform(size: int) -> Case:
+    return Case(lambda texts: QazNLTKVectorizer(sparse=True).fit_transform(texts), [corpus.documents(size)], size)
+
+
+@benchmark("fit_transform_ids")
+def _fit_transform_ids(size: int) -> Case:
+    vocabulary = qaznltk.Vocabulary()
+    encoded = vocabulary.encode_batch(text.lower().split() for text in corpus.documents(size))
+    return Case(lambda documents: QazNLTKVectorizer(sparse=True).fit_transform(documents), [encoded], size)
+
+
+@benchmark("knn_search")
+def _knn_search(size: int) -> Case:
+    # the exhaustive dense search is O(documents x vocabulary) per query, so the index is capped
+    documents = corpus.documents(min(size, 300))
+    vectorizer = QazNLTKVectorizer()
+    knn = KNN(vectorizer.fit_transform(documents))
+    queries = vectorizer.transform(corpus.documents(20, seed=1))
+    return _per_item(lambda query: knn.search(query, k=5), queries)
+
+
+@benchmark("knn_search_batch")
+def _knn_search_batch(size: int) -> Case:
+    vectorizer = QazNLTKVectorizer(sparse=True)
+    knn = KNN(vectorizer.fit_transform(corpus.documents(size)))
+    queries = vectorizer.transform(corpus.documents(100, seed=1))
+    return Case(lambda batch: knn.search_batch(batch, k=10), [queries], 100)
+
+
+@benchmark("bm25_search")
+def _bm25_search(size: int) -> Case:
+    retriever = BM25Retriever()
+    retriever.add_documents(corpus.documents(size))
+    queries = [" ".join(text.split()[:4]) for text in corpus.documents(200, seed=1)]
+    return _per_item(lambda query: retriever.search(query, k=10), queries)
+
+
+@benchmark("calc_wer")
+def _calc_wer(size: int) -> Case:
+    return _per_item(lambda pair: calc_wer(*pair), corpus.pairs(size))
+
+
+@benchmark("bleu_score")
+def _bleu_score(size: int) -> Case:
+    pairs = [([reference], [hypothesis]) for reference, hypothesis in corpus.pairs(size)]
+    return _per_item(lambda pair: bleu_score(*pair), pairs)
+
+
+@benchmark("convert2latin_iso9")
+def _convert2latin(size: int) -> Case:
+    return _per_item(convert2latin_iso9, corpus.documents(size))
+
+
+@benchmark("convert2cyrillic_iso9")
+def _convert2cyrillic(size: int) -> Case:
+    return _per_item(convert2cyrillic_iso9, [convert2latin_iso9(text) for text in corpus.documents(size)])
+
+
+@benchmark("num2word")
+def _num2word(size: int) -> Case:
+    return _per_item(qaznltk.num2word, corpus.numbers(size))
+
+
+@benchmark("word2num")
+def _word2num(size: int) -> Case:
+    # num2word(0) is the empty string, which is not a numeral
+    return _per_item(qaznltk.word2num, qaznltk.num2word_batch(n for n in corpus.numbers(size) if n))
+
+
+def measure(case: Case, repeat: int, memory: bool) -> dict:
+    func, inputs = case.func, case.inputs
+    clock = time.perf_counter_ns
+    best = None
+    latencies: List[int] = []
+    for _ in range(repeat):
+        started = clock()
+        for item in inputs:
+            begin = clock()
+            func(item)
+            latencies.append(clock() - begin)
+        elapsed = clock() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    result = {
+        "items": case.items,
+        "seconds": best / 1e9,
+        "throughput": case.items / (best / 1e9) if best else float("inf"),
+        "p50_us": _percentile(latencies, 50) / 1e3,
+        "p90_us": _percentile(latencies, 90) / 1e3,
+        "p99_us": _percentile(latencies, 99) / 1e3,
+    }
+    if memory:
+        tracemalloc.start()
+        for item in inputs:
+            func(item)
+        result["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result
+
+
+def _percentile(values: List[int], q: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def measure_import(runs: int = 10) -> dict:
+    """Cold ``import qaznltk`` time in a fresh interpreter, minus interpreter start-up."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+
+    def best_of(code: str) -> float:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], env=env, check=True)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    baseline = best_of("pass")
+    return {"import_ms": max(0.0, best_of("import qaznltk") - baseline) * 1e3}
+
+
+def compare(results: dict, baseline: dict, max_slowdown: float, max_memory_growth: float) -> List[str]:
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if "import_ms" in current:
+            ratio = current["import_ms"] / previous["import_ms"] if previous["import_ms"] else 1.0
+            checks = [("import time", ratio, max_slowdown)]
+        else:
+            checks = [("throughput", previous["throughput"] / current["throughput"], max_slowdown)]
+            if current.get("peak_mib") and previous.get("peak_mib"):
+                checks.append(("peak memory", current["peak_mib"] / previous["peak_mib"], max_memory_growth))
+        for label, ratio, limit in checks:
+            marker = "REGRESSION" if ratio > limit else "ok"
+            print(f"{key:40} {label:12} x{ratio:5.2f}  {marker}")
+            if ratio > limit:
+                regressions.append(f"{key} {label}")
+    return regressions
+
+
+def _selected(name: str, pattern: Optional[str]) -> bool:
+    return pattern is None or pattern in name
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the qaznltk benchmark suite.")
+    parser.add_argument("--sizes", default="small,medium", help=f"comma-separated subset of {list(corpus.SIZES)}")
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (default: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--cache", action="store_true", help="keep qaznltk caches enabled while measuring")
+    parser.add_argument("--import-budget", type=float, help="fail if a cold import takes longer (ms)")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare against a JSON file written by --save")
+    parser.add_argument("--max-slowdown", type=float, default=1.25, help="allowed time ratio (default: 1.25)")
+    parser.add_argument("--max-memory-growth", type=float, default=1.25, help="allowed memory ratio (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in args.sizes.split(",") if size]
+    unknown = [size for size in sizes if size not in corpus.SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {unknown}")
+    qaznltk.set_cache_enabled(args.cache)
+
+    results: Dict[str, dict] = {}
+    print(f"{'benchmark':40} {'items/s':>12} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} {'peak MiB':>9}")
+    for name, setup in BENCHMARKS.items():
+        if not _selected(name, args.filter):
+            continue
+        for size in sizes:
+            key = f"{name}[{size}]"
+            result = results[key] = measure(setup(corpus.SIZES[size]), args.repeat, not args.no_memory)
+            peak = f"{result['peak_mib']:9.2f}" if "peak_mib" in result else f"{'-':>9}"
+            print(
+                f"{key:40} {result['throughput']:12,.0f} {result['p50_us']:10.1f} "
+                f"{result['p90_us']:10.1f} {result['p99_us']:10.1f} {peak}",
+                flush=True,
+            )
+    if _selected("import", args.filter):
+        results["import"] = measure_import()
+        print(f"{'import':40} {results['import']['import_ms']:10.1f} ms")
+
+    failures = []
+    if args.import_budget is not None and "import" in results:
+        if results["import"]["import_ms"] > args.import_budget:
+            failures.append(f"import took {results['import']['import_ms']:.1f} ms > {args.import_budget} ms")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        print()
+        failures += compare(results, baseline, args.max_slowdown, args.max_memory_growth)
+    if args.save:
+        meta = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "version": qaznltk.__version__,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,110 @@
 """Public package API for qaznltk."""
 
-from typing import List
+from typing import List, Optional
+from .bm25_retriever import BM25Retriever
+from .cache import cache_stats, clear_caches, configure_cache, set_cache_enabled
 from .exceptions import InvalidInputError, QazNLTKError, ResourceLoadError, UnsupportedFormatError
-from .legacy import convert2cyrillic_iso9, convert2latin_iso9
-from .metrics import bleu_score, calc_cer, calc_levenshtein_distance, calc_wer
+from .iin import IINBatch, get_info_from_iin_batch
+from .instrumentation import (
+    Event,
+    MetricsRegistry,
+    add_sink,
+    is_instrumentation_enabled,
+    metrics_snapshot,
+    prometheus_text,
+    remove_sink,
+    reset_metrics,
+    set_instrumentation_enabled,
+)
+from .legacy import (
+    convert2cyrillic_iso9,
+    convert2cyrillic_iso9_batch,
+    convert2latin_iso9,
+    convert2latin_iso9_batch,
+    transliterate_file,
+)
+from .lexicons import get_lexicon
+from .minhash_lsh import MinHashLSH
+from .metrics import (
+    BleuAccumulator,
+    bleu_score,
+    calc_cer,
+    calc_levenshtein_distance,
+    calc_wer,
+    evaluate_corpus,
+    read_pairs,
+    sentence_bleu_batch,
+)
+from .numerals import num2word_batch, word2num, word2num_batch
 from .qaznltk import QazNLTK
-from .tfidf_vectorizer import KNN, QazNLTKVectorizer
+from .segmenter import SentenceSegmenter
+from .sentiment import SentimentLexicon, SentimentResult
+from .similarity import calc_similarity_matrix, find_similar_pairs
+from .tokenizer import Tokenizer
+from .transliteration import Transliterator
+from .tfidf_vectorizer import KNN, CSRMatrix, QazNLTKHashingVectorizer, QazNLTKVectorizer
+from .vocabulary import Vocabulary
 
 __all__ = [
     "QazNLTK",
+    "Tokenizer",
+    "Vocabulary",
     "QazNLTKVectorizer",
+    "QazNLTKHashingVectorizer",
     "KNN",
+    "CSRMatrix",
+    "BM25Retriever",
+    "MinHashLSH",
     "calc_similarity",
+    "calc_similarity_matrix",
+    "find_similar_pairs",
     "calc_cer",
     "calc_wer",
     "calc_levenshtein_distance",
+    "evaluate_corpus",
+    "read_pairs",
     "get_stop_words",
     "get_positive_words",
     "get_negative_words",
     "get_kaz_alphabet",
+    "get_lexicon",
     "bleu_score",
+    "BleuAccumulator",
+    "sentence_bleu_batch",
     "convert2latin_iso9",
     "convert2cyrillic_iso9",
+    "convert2latin_iso9_batch",
+    "convert2cyrillic_iso9_batch",
+    "transliterate_file",
+    "Transliterator",
     "tokenize",
     "sentimize",
+    "sentimize_batch",
+    "SentimentLexicon",
+    "SentimentResult",
     "sent_tokenize",
+    "iter_sentences",
+    "SentenceSegmenter",
     "num2word",
+    "num2word_batch",
+    "word2num",
+    "word2num_batch",
     "get_info_from_iin",
+    "get_info_from_iin_batch",
+    "IINBatch",
+    "cache_stats",
+    "clear_caches",
+    "configure_cache",
+    "set_cache_enabled",
+    "set_instrumentation_enabled",
+    "is_instrumentation_enabled",
+    "add_sink",
+    "remove_sink",
+    "metrics_snapshot",
+    "reset_metrics",
+    "prometheus_text",
+    "Event",
+    "MetricsRegistry",
     "QazNLTKError",
     "InvalidInputError",
     "ResourceLoadError",
@@ -52,12 +130,18 @@ def get_kaz_alphabet() -> List[str]:
 def calc_similarity(text_a: str, text_b: str) -> float:
     return _instance.calc_similarity(text_a, text_b)
 
-def tokenize(text: str):
-    return _instance.tokenize(text)
+def tokenize(text: str, top_k: Optional[int] = None):
+    return _instance.tokenize(text, top_k)
+
+def sentimize_batch(texts, n_jobs: int = 1, chunksize: int = 1000, inflections: bool = True):
+    return _instance.sentimize_batch(texts, n_jobs, chunksize, inflections)
 
 def sent_tokenize(text: str):
     return _instance.sent_tokenize(text)
 
+def iter_sentences(source):
+    return _instance.iter_sentences(source)
+
 def sentimize(text):
     return _instance.sentimize(text)
 
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .exceptions import InvalidInputError
+from .instrumentation import instrumented
+from .tfidf_vectorizer import _resolve_stop_words
+from .utils import tokenize_words
+
+
+class BM25Retriever:
+    """Okapi BM25 retriever over an incremental inverted index.
+
+    Documents are tokenized with ``utils.tokenize_words`` and each term keeps a
+    posting list of ``(doc_id, tf)`` pairs. ``search`` uses MaxScore dynamic
+    pruning, so query latency depends on the posting lists of the query terms
+    rather than on the size of the corpus.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, stop_words: Union[str, Iterable[str], None] = None):
+        # ~ stop_words="kazakh" drops the bundled Kazakh stop words from the index, as in QazNLTKVectorizer
+        if k1 < 0 or not 0 <= b <= 1:
+            raise InvalidInputError("k1 must be >= 0 and b must be in [0, 1]")
+        self.k1 = k1
+        self.b = b
+        self.stop_words = _resolve_stop_words(stop_words)
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.max_tf: Dict[str, int] = {}
+        self.doc_lengths = array("i")
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def _tokenize(self, text: str) -> List[str]:
+        stop_words = self.stop_words
+        return [token for token in tokenize_words(text) if token not in stop_words]
+
+    def add_documents(self, documents: Iterable[str]) -> range:
+        """Index new documents and return the range of their document ids."""
+        first_id = len(self.doc_lengths)
+        doc_id = first_id
+        for doc in documents:
+            tokens = self._tokenize(doc)
+            for term, tf in Counter(tokens).items():
+                posting = self.postings.get(term)
+                if posting is None:
+                    posting = self.postings[term] = (array("i"), array("i"))
+                    self.max_tf[term] = tf
+                elif tf > self.max_tf[term]:
+                    self.max_tf[term] = tf
+                # ~ ids only grow, so every posting list stays sorted by doc id
+                posting[0].append(doc_id)
+                posting[1].append(tf)
+            self.doc_lengths.append(len(tokens))
+            self.total_length += len(tokens)
+            doc_id += 1
+        return range(first_id, doc_id)
+
+    def idf(self, term: str) -> float:
+        """Return the (non-negative) BM25 inverse document frequency of a term."""
+        posting = self.postings.get(term)
+        df = len(posting[0]) if posting else 0
+        num_docs = len(self.doc_lengths)
+        return math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+
+    def score(self, query: str, doc_id: int) -> float:
+        """Score a single document against a query without pruning."""
+        total = 0.0
+        for term, weight, doc_ids, tfs, _ in self.__query_terms(query):
+            pos = bisect_left(doc_ids, doc_id)
+            if pos < len(doc_ids) and doc_ids[pos] == doc_id:
+                total += weight * self.__tf_part(tfs[pos], doc_id)
+        return total
+
+    @instrumented("BM25Retriever.search", size=lambda self, query, *args, **kwargs: len(query))
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Return the top-k ``(doc_id, score)`` pairs, best first."""
+        if not isinstance(query, str):
+            raise InvalidInputError("query must be a string")
+        terms = self.__query_terms(query)
+        if k <= 0 or not terms:
+            return []
+
+        # ~ MaxScore: terms sorted by upper bound; the low-bound prefix whose
+        # ~ cumulative bound cannot beat the threshold is only probed, never scanned
+        terms.sort(key=lambda item: item[4])
+        prefix_bounds = []
+        running = 0.0
+        for term in terms:
+            running += term[4]
+            prefix_bounds.append(running)
+
+        cursors = [0] * len(terms)
+        first_essential = 0
+        threshold = -math.inf
+        heap: List[Tuple[float, int]] = []
+
+        while True:
+            candidate = None
+            for i in range(first_essential, len(terms)):
+                doc_ids = terms[i][2]
+                if cursors[i] < len(doc_ids):
+                    doc_id = doc_ids[cursors[i]]
+                    if candidate is None or doc_id < candidate:
+                        candidate = doc_id
+            if candidate is None:
+                break
+
+            score = 0.0
+            for i in range(first_essential, len(terms)):
+                _, weight, doc_ids, tfs, _ = terms[i]
+                pos = cursors[i]
+                if pos < len(doc_ids) and doc_ids[pos] == candidate:
+                    score += weight * self.__tf_part(tfs[pos], candidate)
+                    cursors[i] = pos + 1
+
+            for i in range(first_essential - 1, -1, -1):
+                if score + prefix_bounds[i] <= threshold:
+                    break
+                _, weight, doc_ids, tfs, _ = terms[i]
+                pos = bisect_left(doc_ids, candidate, cursors[i])
+                cursors[i] = pos
+                if pos < len(doc_ids) and doc_ids[pos] == candidate:
+                    score += weight * self.__tf_part(tfs[pos], candidate)
+
+            # ~ candidates arrive in doc id order, so ties keep the earlier document
+            entry = (score, -candidate)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            else:
+                continue
+            if len(heap) == k:
+                threshold = heap[0][0]
+                while first_essential < len(terms) and prefix_bounds[first_essential] <= threshold:
+                    first_essential += 1
+
+        return [(-neg_id, score) for score, neg_id in sorted(heap, reverse=True)]
+
+    def __tf_part(self, tf: int, doc_id: int) -> float:
+        avg_length = self.total_length / len(self.doc_lengths)
+        norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length) if avg_length else self.k1
+        return tf * (self.k1 + 1) / (tf + norm)
+
+    def __query_terms(self, query: str) -> List[tuple]:
+        # ~ (term, weight, doc_ids, tfs, upper_bound) for query terms present in the index
+        terms = []
+        for term, qtf in Counter(self._tokenize(query)).items():
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            weight = qtf * self.idf(term)
+            max_tf = self.max_tf[term]
+            # ~ tf / (tf + k1 * (1 - b + b * dl / avgdl)) is maximal at max_tf and dl = 0
+            bound = weight * max_tf * (self.k1 + 1) / (max_tf + self.k1 * (1 - self.b))
+            terms.append((term, weight, posting[0], posting[1], bound))
+        return terms
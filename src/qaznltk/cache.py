@@ -0,0 +1,182 @@
+"""Bounded, observable memoization for qaznltk hot paths."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from .exceptions import InvalidInputError
+
+_enabled = True
+_registry: Dict[str, "BoundedCache"] = {}
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+    maxbytes: Optional[int]
+    currbytes: int
+
+
+def approx_size(obj: Any) -> int:
+    """Approximate the memory footprint of a cache key or value in bytes."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, frozenset, set)):
+        size += sum(approx_size(item) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(approx_size(key) + approx_size(value) for key, value in obj.items())
+    return size
+
+
+class BoundedCache:
+    """Thread-safe LRU cache bounded by entry count and optionally by bytes and TTL.
+
+    ``maxsize=0`` disables caching. Expired entries are dropped lazily on
+    access and counted as evictions.
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: Optional[int] = None, ttl: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.configure(maxsize, maxbytes, ttl)
+
+    def configure(self, maxsize: int, maxbytes: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """Change the bounds; existing entries and statistics are cleared."""
+        if maxsize < 0 or (maxbytes is not None and maxbytes < 0) or (ttl is not None and ttl <= 0):
+            raise InvalidInputError("maxsize and maxbytes must be non-negative and ttl positive")
+        with self._lock:
+            self.maxsize = maxsize
+            self.maxbytes = maxbytes
+            self.ttl = ttl
+            self._data.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def get(self, key: Any, default: Any = _MISSING) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, size, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                self._remove(key)
+            self._misses += 1
+            return default
+
+    def put(self, key: Any, value: Any) -> None:
+        if not self.maxsize:
+            return
+        size = approx_size(key) + approx_size(value)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[1]
+            self._data[key] = (value, size, expires_at)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+                self._remove(next(iter(self._data)))
+
+    def _remove(self, key: Any) -> None:
+        self._bytes -= self._data.pop(key)[1]
+        self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self.maxsize, len(self._data), self.maxbytes, self._bytes
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached(name: str, maxsize: int = 1024, maxbytes: Optional[int] = None, ttl: Optional[float] = None) -> Callable:
+    """Memoize a function in a named ``BoundedCache`` registered for ``configure_cache``.
+
+    The wrapped function accepts ``use_cache=False`` to bypass the cache for a
+    single call. Calls with unhashable arguments are never cached. Argument
+    types are part of the key (as with ``lru_cache(typed=True)``), so ``f(1)``,
+    ``f(1.0)`` and ``f(True)`` are cached separately.
+    """
+    cache = _registry[name] = BoundedCache(maxsize, maxbytes, ttl)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, use_cache: bool = True, **kwargs):
+            if not (use_cache and _enabled and cache.maxsize):
+                return func(*args, **kwargs)
+            key = _make_key(args, kwargs)
+            try:
+                value = cache.get(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    # ~ equal values of different types (1, 1.0, True) must not share an entry
+    key = args + tuple(map(type, args))
+    if kwargs:
+        items = tuple(sorted(kwargs.items()))
+        key += (_MISSING,) + items + tuple(type(value) for _, value in items)
+    return key
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Globally enable or disable every qaznltk cache."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_cache_enabled() -> bool:
+    return _enabled
+
+
+def get_cache(name: str) -> BoundedCache:
+    """Return a registered cache, e.g. ``"levenshtein_distance"``, ``"tokenize"`` or ``"num2word"``."""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise InvalidInputError(f"Unknown cache {name!r}; available: {sorted(_registry)}") from None
+
+
+def configure_cache(name: str, maxsize: int, maxbytes: Optional[int] = None, ttl: Optional[float] = None) -> None:
+    """Re-bound a registered cache (``maxsize=0`` turns it off)."""
+    get_cache(name).configure(maxsize, maxbytes, ttl)
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Return hit/miss/eviction statistics for every registered cache."""
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+def clear_caches() -> None:
+    for cache in _registry.values():
+        cache.clear()
@@ -0,0 +1,212 @@
+"""``qaznltk`` command line: stream a corpus through QazNLTK operations, one JSON line per record."""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .exceptions import QazNLTKError
+from .utils import imap_bounded, iter_chunks
+
+OPERATIONS = ("tokenize", "sentimize", "transliterate", "sent_tokenize", "num2word", "iin", "cer", "wer")
+FORMATS = ("jsonl", "tsv", "lines")
+_PAIR_OPERATIONS = ("cer", "wer")
+
+
+class _Config(NamedTuple):
+    operations: Tuple[str, ...]
+    input_format: str
+    columns: Tuple[str, ...]
+    text_field: str
+    reference_field: str
+    hypothesis_field: str
+    target: str
+    add_line: bool
+
+
+# per-process QazNLTK instance, created on the first chunk a worker receives
+_qn = None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="qaznltk",
+        description="Apply QazNLTK operations to every record of a JSONL, TSV or plain-text corpus "
+        "and write one JSON object per record.",
+        epilog="Records that fail get an 'error' field instead of aborting the run; "
+        "the exit status is 1 if any record failed.",
+    )
+    parser.add_argument("operations", nargs="+", choices=OPERATIONS, metavar="OPERATION",
+                        help=f"one or more of: {', '.join(OPERATIONS)}")
+    parser.add_argument("-i", "--input", default="-", help="input file, '-' for stdin; '.gz' files are decompressed")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout; '.gz' files are compressed")
+    parser.add_argument("-f", "--format", choices=("auto",) + FORMATS, default="auto",
+                        help="input format; 'auto' guesses from the file extension (default: auto)")
+    parser.add_argument("--columns", help="comma-separated TSV column names "
+                        "(default: 'reference,hypothesis' for cer/wer, otherwise 'text')")
+    parser.add_argument("--text-field", default="text", help="field holding the text (default: text)")
+    parser.add_argument("--reference-field", default="reference", help="reference field for cer/wer")
+    parser.add_argument("--hypothesis-field", default="hypothesis", help="hypothesis field for cer/wer")
+    parser.add_argument("--target", choices=("latin", "cyrillic"), default="latin",
+                        help="transliteration target (default: latin)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes, -1 for all CPUs (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per worker task (default: 1000)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write chunks as soon as they finish; records get a 'line' field")
+    parser.add_argument("--progress", action="store_true", help="report throughput on stderr")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    operations = tuple(dict.fromkeys(args.operations))
+    input_format = args.format if args.format != "auto" else _guess_format(args.input)
+    if args.columns:
+        columns = tuple(args.columns.split(","))
+    elif any(operation in _PAIR_OPERATIONS for operation in operations):
+        columns = (args.reference_field, args.hypothesis_field)
+    else:
+        columns = (args.text_field,)
+    if args.chunk_size <= 0:
+        print("qaznltk: --chunk-size must be positive", file=sys.stderr)
+        return 2
+    if args.jobs == 0:
+        print("qaznltk: --jobs must be a non-zero integer", file=sys.stderr)
+        return 2
+    config = _Config(
+        operations, input_format, columns, args.text_field, args.reference_field,
+        args.hypothesis_field, args.target, args.unordered,
+    )
+
+    records = errors = 0
+    started = last_report = time.monotonic()
+    with _open_text(args.input, "r") as src, _open_text(args.output, "w") as dst:
+        tasks = ((config, start, lines) for start, lines in _numbered_chunks(src, args.chunk_size))
+        for lines, chunk_errors in imap_bounded(_process_chunk, tasks, args.jobs, ordered=not args.unordered):
+            dst.writelines(lines)
+            records += len(lines)
+            errors += chunk_errors
+            if args.progress and time.monotonic() - last_report >= 1.0:
+                last_report = time.monotonic()
+                _report(records, errors, last_report - started)
+    if args.progress:
+        _report(records, errors, time.monotonic() - started)
+    return 1 if errors else 0
+
+
+def _report(records: int, errors: int, elapsed: float) -> None:
+    rate = records / elapsed if elapsed > 0 else 0.0
+    print(f"qaznltk: {records:,} records ({errors:,} errors) in {elapsed:.1f}s, {rate:,.0f} records/s",
+          file=sys.stderr, flush=True)
+
+
+def _guess_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    if name.endswith(".tsv"):
+        return "tsv"
+    return "lines"
+
+
+@contextmanager
+def _open_text(path: str, mode: str) -> Iterator[IO[str]]:
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer if mode == "r" else sys.stdout.buffer, encoding="utf-8")
+        try:
+            yield stream
+        finally:
+            # leave the process's stdin/stdout open
+            stream.flush()
+            stream.detach()
+        return
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, mode + "t", encoding="utf-8") as stream:
+        yield stream
+
+
+def _numbered_chunks(lines: IO[str], size: int) -> Iterator[Tuple[int, List[str]]]:
+    start = 1
+    for chunk in iter_chunks(lines, size):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _process_chunk(task: Tuple[_Config, int, List[str]]) -> Tuple[List[str], int]:
+    # parsing, processing and serialization all happen in the worker
+    global _qn
+    if _qn is None:
+        from .qaznltk import QazNLTK
+
+        _qn = QazNLTK()
+    config, start, lines = task
+    output = []
+    errors = 0
+    for line_number, line in enumerate(lines, start):
+        line = line.rstrip("\r\n")
+        if config.input_format == "jsonl" and not line.strip():
+            continue
+        record = _apply_all(config, line, line_number)
+        errors += "error" in record
+        output.append(json.dumps(record, ensure_ascii=False) + "\n")
+    return output, errors
+
+
+def _apply_all(config: _Config, line: str, line_number: int) -> dict:
+    try:
+        record = _parse(config, line)
+    except (ValueError, QazNLTKError) as e:
+        return {"line": line_number, "error": f"parse: {e}"}
+    if config.add_line:
+        record["line"] = line_number
+    for operation in config.operations:
+        try:
+            record[operation] = _apply(operation, record, config)
+        except KeyError as e:
+            record["error"] = f"{operation}: missing field {e}"
+            break
+        except (ValueError, TypeError, QazNLTKError) as e:
+            record["error"] = f"{operation}: {e}"
+            break
+    return record
+
+
+def _parse(config: _Config, line: str) -> dict:
+    if config.input_format == "jsonl":
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("every JSONL line must be an object")
+        return record
+    if config.input_format == "tsv":
+        cells = line.split("\t")
+        if len(cells) < len(config.columns):
+            raise ValueError(f"expected {len(config.columns)} tab-separated columns, got {len(cells)}")
+        return dict(zip(config.columns, cells))
+    return {config.text_field: line}
+
+
+def _apply(operation: str, record: dict, config: _Config):
+    if operation in _PAIR_OPERATIONS:
+        reference = record[config.reference_field]
+        hypothesis = record[config.hypothesis_field]
+        return _qn.calc_cer(reference, hypothesis) if operation == "cer" else _qn.calc_wer(reference, hypothesis)
+    value = record[config.text_field]
+    if operation == "tokenize":
+        return _qn.tokenize(value)
+    if operation == "sentimize":
+        return _qn.sentimize(value)
+    if operation == "transliterate":
+        if config.target == "latin":
+            return _qn.convert2latin_iso9(value)
+        return _qn.convert2cyrillic_iso9(value)
+    if operation == "sent_tokenize":
+        return _qn.sent_tokenize(value)
+    if operation == "num2word":
+        return _qn.num2word(int(value))
+    return _qn.get_info_from_iin(str(value))
@@ -0,0 +1,249 @@
+"""Bulk IIN validation and decoding with columnar results.
+
+Every IIN is a 12-byte ASCII record. A batch is split into one byte column
+per digit position (``block[i::12]``), and all checks run column-wise in C:
+``bytes.translate`` tables do per-digit lookups (digit values, weighted
+digits mod 11, century, days per month) and arithmetic on big integers built
+from the columns adds or masks all records at once. Lane widths are chosen so
+that no intermediate value carries into the neighbouring record.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional, Union
+
+from .exceptions import InvalidInputError
+
+IIN_LENGTH = 12
+
+OK, BAD_FORMAT, BAD_CENTURY, BAD_DATE, BAD_CHECKSUM = range(5)
+
+ERROR_MESSAGES = {
+    BAD_FORMAT: "Incorrect IIN. The length of the IIN must be 12 digits.",
+    BAD_CENTURY: "Incorrect IIN. The first digit of the IIN must be in the range [1, 6].",
+    BAD_DATE: "Incorrect IIN. The date of birth is incorrect.",
+    BAD_CHECKSUM: "Incorrect IIN. Control discharge does not match.",
+}
+
+_WEIGHTS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+_RETRY_WEIGHTS = (3, 4, 5, 6, 7, 8, 9, 10, 11, 1, 2)
+_CENTURY_START = {ord("1"): 1800, ord("2"): 1800, ord("3"): 1900, ord("4"): 1900, ord("5"): 2000, ord("6"): 2000}
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _table(func) -> bytes:
+    return bytes(func(value) & 0xFF for value in range(256))
+
+
+def _digit(char: int) -> int:
+    return char - 48 if 48 <= char <= 57 else 0
+
+
+_DIGIT = _table(_digit)
+_TENS = _table(lambda char: 10 * _digit(char))
+_NOT_DIGIT = _table(lambda char: 0 if 48 <= char <= 57 else 1)
+_NONZERO = _table(lambda value: 1 if value else 0)
+_IS_ZERO = _table(lambda value: 0 if value else 1)
+_ZERO_TO_FF = _table(lambda value: 0 if value else 0xFF)
+_MOD11 = _table(lambda value: value % 11)
+_TEN_TO_FF = _table(lambda value: 0xFF if value == 10 else 0)
+_TEN_TO_ZERO = _table(lambda value: 0 if value == 10 else value)
+_AT_LEAST_128 = _table(lambda value: 1 if value >= 128 else 0)
+_DIVISIBLE_BY_4 = _table(lambda value: 1 if value % 4 == 0 else 0)
+_BAD_CENTURY = _table(lambda char: 0 if char in _CENTURY_START else 1)
+_IS_2000S = _table(lambda char: 1 if _CENTURY_START.get(char) == 2000 else 0)
+_CENTURY_HIGH = _table(lambda char: _CENTURY_START.get(char, 0) >> 8)
+_CENTURY_LOW = _table(lambda char: _CENTURY_START.get(char, 0))
+_GENDER = _table(lambda char: (1 if char % 2 else 2) if char in _CENTURY_START else 0)
+# ~ key = 2 * month + is_leap_year
+_MAX_DAY = _table(
+    lambda key: (29 if key == 5 else _DAYS_IN_MONTH[key >> 1]) if 1 <= key >> 1 <= 12 else 0
+)
+# ~ key = 8 * bad_format + 4 * bad_century + 2 * bad_date + bad_checksum; the first failing check wins
+_ERROR_CODE = _table(
+    lambda key: (
+        BAD_FORMAT if key & 8 else BAD_CENTURY if key & 4 else BAD_DATE if key & 2 else BAD_CHECKSUM if key & 1 else OK
+    )
+)
+_WEIGHTED = [_table(lambda char, w=w: _digit(char) * w % 11) for w in _WEIGHTS]
+_RETRY_WEIGHTED = [_table(lambda char, w=w: _digit(char) * w % 11) for w in _RETRY_WEIGHTS]
+
+
+class IINBatch:
+    """Columnar result of ``get_info_from_iin_batch``; every column has one entry per IIN.
+
+    ``valid`` is 1 for IINs that pass every check and ``error`` holds the
+    code of the first failing check (``OK``, ``BAD_FORMAT``, ``BAD_CENTURY``,
+    ``BAD_DATE``, ``BAD_CHECKSUM``). Decoded columns (``year``, ``month``,
+    ``day``, ``gender`` with 1 male / 2 female, ``sequence_number`` and
+    ``control_discharge``) are 0 for invalid IINs.
+    """
+
+    __slots__ = ("valid", "error", "year", "month", "day", "gender", "sequence_number", "control_discharge")
+
+    def __init__(self) -> None:
+        self.valid = array("B")
+        self.error = array("B")
+        self.year = array("H")
+        self.month = array("B")
+        self.day = array("B")
+        self.gender = array("B")
+        self.sequence_number = array("H")
+        self.control_discharge = array("B")
+
+    def __len__(self) -> int:
+        return len(self.error)
+
+    def record(self, i: int) -> dict:
+        """Return the ``get_info_from_iin`` dict of the i-th IIN."""
+        error = self.error[i]
+        if error != OK:
+            return {"status": "error", "message": ERROR_MESSAGES[error]}
+        year = self.year[i]
+        return {
+            "status": "success",
+            "date_of_birth": f"{self.day[i]:02d}.{self.month[i]:02d}.{year}",
+            "century_of_birth": f"{year // 100 + 1}",
+            "gender": "male" if self.gender[i] == 1 else "female",
+            "sequence_number": self.sequence_number[i],
+            "control_discharge": self.control_discharge[i],
+        }
+
+    def records(self) -> Iterator[dict]:
+        return map(self.record, range(len(self)))
+
+
+def get_info_from_iin_batch(
+    iins: Union[Iterable[Union[str, bytes]], bytes, bytearray, memoryview], block_size: int = 1 << 16
+) -> IINBatch:
+    """Validate and decode many IINs at once.
+
+    ``iins`` is an iterable of ``str``/``bytes`` IINs or a bytes-like buffer
+    of concatenated 12-byte ASCII records (e.g. a NumPy ``S12`` array).
+    Results match ``get_info_from_iin``, except that only ASCII digits are
+    accepted.
+    """
+    if block_size <= 0:
+        raise InvalidInputError("block_size must be positive")
+    data = _pack(iins)
+    batch = IINBatch()
+    step = block_size * IIN_LENGTH
+    for start in range(0, len(data), step):
+        _decode_block(data[start : start + step], batch)
+    return batch
+
+
+def _pack(iins) -> bytes:
+    if isinstance(iins, (str, bytes, bytearray, memoryview)) or hasattr(iins, "__array_interface__"):
+        if isinstance(iins, str):
+            raise InvalidInputError("pass a sequence of IINs, not a single string")
+        view = memoryview(iins)
+        # ~ only byte buffers or 12-byte string records (NumPy "S12") hold ASCII IINs;
+        # ~ int, unicode or float buffers would be reinterpreted byte by byte
+        if not (view.itemsize == 1 and view.format in ("B", "b", "c")) and not (
+            view.itemsize == IIN_LENGTH and view.format == f"{IIN_LENGTH}s"
+        ):
+            raise InvalidInputError(
+                f"packed IIN buffers must be bytes-like (format 'B', 'b', 'c' or '{IIN_LENGTH}s'), "
+                f"got format {view.format!r} with itemsize {view.itemsize}"
+            )
+        data = view.tobytes()
+        if len(data) % IIN_LENGTH:
+            raise InvalidInputError(f"packed IIN buffers must hold {IIN_LENGTH}-byte records")
+        return data
+    items = iins if isinstance(iins, (list, tuple)) else list(iins)
+    # fast path: every item is a 12-character ASCII string (or every item 12 bytes)
+    try:
+        if all(len(item) == IIN_LENGTH for item in items):
+            if all(type(item) is str for item in items):
+                joined = "".join(items)
+                if joined.isascii():
+                    return joined.encode("ascii")
+            elif all(isinstance(item, bytes) for item in items):
+                return b"".join(items)
+    except TypeError:
+        pass
+    return b"".join(map(_pack_one, items))
+
+
+def _pack_one(item) -> bytes:
+    if isinstance(item, str):
+        item = item.encode("utf-8")
+    elif not isinstance(item, (bytes, bytearray)):
+        raise InvalidInputError("IINs must be strings or bytes")
+    # ~ anything that is not 12 ASCII bytes becomes a record that fails the digit check
+    return bytes(item) if len(item) == IIN_LENGTH and item.isascii() else b"?" * IIN_LENGTH
+
+
+def _decode_block(block: bytes, batch: IINBatch) -> None:
+    n = len(block) // IIN_LENGTH
+    columns = [block[i::IIN_LENGTH] for i in range(IIN_LENGTH)]
+    ones = _lanes(b"\x01" * n)
+
+    def lanes(column: bytes, table: Optional[bytes] = None) -> int:
+        return _lanes(column.translate(table) if table is not None else column)
+
+    def column(value: int) -> bytes:
+        return value.to_bytes(n, "big")
+
+    bad_format = 0
+    for raw in columns:
+        bad_format |= lanes(raw, _NOT_DIGIT)
+    bad_century = lanes(columns[6], _BAD_CENTURY)
+
+    year = column(lanes(columns[0], _TENS) + lanes(columns[1], _DIGIT))
+    month = column(lanes(columns[2], _TENS) + lanes(columns[3], _DIGIT))
+    day = column(lanes(columns[4], _TENS) + lanes(columns[5], _DIGIT))
+    # ~ 1800 and 1900 are not leap years, 2000 is
+    not_2000s = ones ^ lanes(columns[6], _IS_2000S)
+    leap = lanes(year, _DIVISIBLE_BY_4) & (ones ^ (lanes(year, _IS_ZERO) & not_2000s))
+    max_day = column(2 * _lanes(month) + leap).translate(_MAX_DAY)
+    # ~ max_day + 128 - day stays within [29, 159], so lanes never borrow
+    fits = lanes(column(_lanes(max_day) + 128 * ones - _lanes(day)), _AT_LEAST_128)
+    bad_date = ones ^ (fits & lanes(day, _NONZERO))
+
+    first = column(sum(lanes(raw, table) for raw, table in zip(columns, _WEIGHTED))).translate(_MOD11)
+    retry = column(sum(lanes(raw, table) for raw, table in zip(columns, _RETRY_WEIGHTED))).translate(_MOD11)
+    checksum = lanes(first, _TEN_TO_ZERO) | (_lanes(retry) & lanes(first, _TEN_TO_FF))
+    bad_checksum = lanes(column(checksum ^ lanes(columns[11], _DIGIT)), _NONZERO)
+
+    error = column(8 * bad_format + 4 * bad_century + 2 * bad_date + bad_checksum).translate(_ERROR_CODE)
+    mask = lanes(error, _ZERO_TO_FF)
+
+    batch.error.frombytes(error)
+    batch.valid.frombytes(error.translate(_IS_ZERO))
+    batch.month.frombytes(column(_lanes(month) & mask))
+    batch.day.frombytes(column(_lanes(day) & mask))
+    batch.gender.frombytes(column(lanes(columns[6], _GENDER) & mask))
+    batch.control_discharge.frombytes(column(lanes(columns[11], _DIGIT) & mask))
+
+    wide_mask = _wide_lanes(column(mask), column(mask))
+    century = _wide_lanes(columns[6].translate(_CENTURY_HIGH), columns[6].translate(_CENTURY_LOW))
+    batch.year.extend(_unwide((century + _wide_lanes(None, year)) & wide_mask, n))
+    sequence = sum(
+        scale * _wide_lanes(None, columns[i].translate(_DIGIT)) for i, scale in ((7, 1000), (8, 100), (9, 10), (10, 1))
+    )
+    batch.sequence_number.extend(_unwide(sequence & wide_mask, n))
+
+
+def _lanes(column: bytes) -> int:
+    return int.from_bytes(column, "big")
+
+
+def _wide_lanes(high: Optional[bytes], low: bytes) -> int:
+    # ~ 16-bit big-endian lanes from a high-byte and a low-byte column
+    wide = bytearray(2 * len(low))
+    if high is not None:
+        wide[0::2] = high
+    wide[1::2] = low
+    return int.from_bytes(wide, "big")
+
+
+def _unwide(value: int, n: int) -> array:
+    result = array("H")
+    result.frombytes(value.to_bytes(2 * n, "big"))
+    if sys.byteorder == "little":
+        result.byteswap()
+    return result
@@ -0,0 +1,221 @@
+"""Opt-in call counts, latency and input-size histograms for qaznltk hot paths."""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .cache import cache_stats
+
+_enabled = False
+
+# upper bucket bounds; the last bucket (+Inf) is implicit
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, 10.0,
+)
+SIZE_BUCKETS: Tuple[int, ...] = tuple(4**i for i in range(13))
+
+
+class Event(NamedTuple):
+    """One instrumented call, as delivered to every sink."""
+
+    operation: str
+    seconds: float
+    size: Optional[int]
+    error: bool
+
+
+class OperationStats:
+    """Call count, error count, total time and latency/size histograms of one operation."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.size_counts = [0] * (len(SIZE_BUCKETS) + 1)
+        self.size_total = 0
+
+    def add(self, event: Event) -> None:
+        self.calls += 1
+        self.errors += event.error
+        self.seconds += event.seconds
+        self.latency_counts[bisect_left(LATENCY_BUCKETS, event.seconds)] += 1
+        if event.size is not None:
+            self.size_counts[bisect_left(SIZE_BUCKETS, event.size)] += 1
+            self.size_total += event.size
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile in seconds as the upper bound of its bucket."""
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.latency_counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "seconds": self.seconds,
+            "mean_seconds": self.seconds / self.calls if self.calls else 0.0,
+            "p50_seconds": self.quantile(0.5),
+            "p99_seconds": self.quantile(0.99),
+            "latency_buckets": dict(zip(LATENCY_BUCKETS + (float("inf"),), self.latency_counts)),
+            "size_buckets": dict(zip(SIZE_BUCKETS + (float("inf"),), self.size_counts)),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe in-process sink that aggregates events per operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationStats] = {}
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            stats = self._operations.get(event.operation)
+            if stats is None:
+                stats = self._operations[event.operation] = OperationStats()
+            stats.add(event)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._operations.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+
+    def prometheus_text(self) -> str:
+        """Render operations and cache statistics in the Prometheus text exposition format."""
+        with self._lock:
+            operations = sorted(self._operations.items())
+            lines = [
+                "# HELP qaznltk_operation_seconds Latency of instrumented qaznltk calls.",
+                "# TYPE qaznltk_operation_seconds histogram",
+            ]
+            for name, stats in operations:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), stats.latency_counts):
+                    cumulative += count
+                    lines.append(f'qaznltk_operation_seconds_bucket{{operation="{name}",le="{_le(bound)}"}} {cumulative}')
+                lines.append(f'qaznltk_operation_seconds_sum{{operation="{name}"}} {stats.seconds!r}')
+                lines.append(f'qaznltk_operation_seconds_count{{operation="{name}"}} {stats.calls}')
+            lines += [
+                "# HELP qaznltk_operation_input_size Input size of instrumented qaznltk calls.",
+                "# TYPE qaznltk_operation_input_size histogram",
+            ]
+            for name, stats in operations:
+                cumulative = 0
+                for bound, count in zip(SIZE_BUCKETS + (float("inf"),), stats.size_counts):
+                    cumulative += count
+                    lines.append(f'qaznltk_operation_input_size_bucket{{operation="{name}",le="{_le(bound)}"}} {cumulative}')
+                lines.append(f'qaznltk_operation_input_size_sum{{operation="{name}"}} {stats.size_total}')
+                lines.append(f'qaznltk_operation_input_size_count{{operation="{name}"}} {cumulative}')
+            lines += ["# HELP qaznltk_operation_errors_total Instrumented calls that raised.",
+                      "# TYPE qaznltk_operation_errors_total counter"]
+            lines += [f'qaznltk_operation_errors_total{{operation="{name}"}} {stats.errors}' for name, stats in operations]
+        caches = sorted(cache_stats().items())
+        for metric, field, kind in (
+            ("cache_hits_total", "hits", "counter"),
+            ("cache_misses_total", "misses", "counter"),
+            ("cache_evictions_total", "evictions", "counter"),
+            ("cache_entries", "currsize", "gauge"),
+            ("cache_bytes", "currbytes", "gauge"),
+        ):
+            lines.append(f"# TYPE qaznltk_{metric} {kind}")
+            lines += [f'qaznltk_{metric}{{cache="{name}"}} {getattr(stats, field)}' for name, stats in caches]
+        return "\n".join(lines) + "\n"
+
+
+def _le(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+registry = MetricsRegistry()
+_sinks: List[Callable[[Event], None]] = [registry]
+
+
+def instrumented(operation: str, size: Optional[Callable[..., int]] = None) -> Callable:
+    """Report every call of the wrapped function to the sinks while instrumentation is enabled.
+
+    ``size`` receives the call's arguments and returns the input size to
+    record. When disabled the only overhead is one flag check per call.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                elapsed = time.perf_counter() - started
+                try:
+                    input_size = size(*args, **kwargs) if size is not None else None
+                except Exception:
+                    input_size = None
+                _emit(Event(operation, elapsed, input_size, error))
+
+        return wrapper
+
+    return decorator
+
+
+def _emit(event: Event) -> None:
+    for sink in _sinks:
+        try:
+            sink(event)
+        except Exception:
+            # a failing sink must never break the instrumented call
+            pass
+
+
+def set_instrumentation_enabled(enabled: bool) -> None:
+    """Globally enable or disable instrumentation (disabled by default)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_instrumentation_enabled() -> bool:
+    return _enabled
+
+
+def add_sink(sink: Callable[[Event], None]) -> None:
+    """Deliver every ``Event`` to ``sink`` as well, e.g. a callback forwarding to StatsD or a log."""
+    _sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[Event], None]) -> None:
+    _sinks.remove(sink)
+
+
+def metrics_snapshot() -> dict:
+    """Return per-operation statistics from the in-process registry plus cache hit rates."""
+    caches = {
+        name: {**stats._asdict(), "hit_rate": stats.hits / (stats.hits + stats.misses) if stats.hits + stats.misses else 0.0}
+        for name, stats in cache_stats().items()
+    }
+    return {"operations": registry.snapshot(), "caches": caches}
+
+
+def reset_metrics() -> None:
+    registry.reset()
+
+
+def prometheus_text() -> str:
+    return registry.prometheus_text()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from typing import Iterable, Iterator
+
 from .exceptions import InvalidInputError
+from .transliteration import Transliterator
 
 
 CYRILLIC_TO_ISO9_MAPPING = {
@@ -51,15 +54,35 @@ CYRILLIC_TO_ISO9_MAPPING = {
 ISO9_TO_CYRILLIC_MAPPING = {value: key for key, value in CYRILLIC_TO_ISO9_MAPPING.items()}
 
 
+TO_LATIN_ISO9 = Transliterator(CYRILLIC_TO_ISO9_MAPPING)
+TO_CYRILLIC_ISO9 = Transliterator(ISO9_TO_CYRILLIC_MAPPING)
+
+
 def convert2latin_iso9(text: str) -> str:
     """Convert Kazakh Cyrillic text to ISO-9 Latin representation."""
-    if not isinstance(text, str):
-        raise InvalidInputError("text must be a string")
-    return ''.join(CYRILLIC_TO_ISO9_MAPPING.get(char, char) for char in text)
+    return TO_LATIN_ISO9.convert(text)
 
 
 def convert2cyrillic_iso9(text: str) -> str:
     """Convert ISO-9 Latin text back to Cyrillic representation."""
-    if not isinstance(text, str):
-        raise InvalidInputError("text must be a string")
-    return ''.join(ISO9_TO_CYRILLIC_MAPPING.get(char, char) for char in text)
+    return TO_CYRILLIC_ISO9.convert(text)
+
+
+def convert2latin_iso9_batch(texts: Iterable[str]) -> Iterator[str]:
+    """Lazily convert many Cyrillic texts to ISO-9 Latin."""
+    return TO_LATIN_ISO9.convert_batch(texts)
+
+
+def convert2cyrillic_iso9_batch(texts: Iterable[str]) -> Iterator[str]:
+    """Lazily convert many ISO-9 Latin texts to Cyrillic."""
+    return TO_CYRILLIC_ISO9.convert_batch(texts)
+
+
+def transliterate_file(
+    src_path: str, dst_path: str, target: str = "latin", encoding: str = "utf-8", chunk_size: int = 1 << 20
+) -> None:
+    """Stream a text file through ISO-9 transliteration (``target`` is ``"latin"`` or ``"cyrillic"``)."""
+    if target not in ("latin", "cyrillic"):
+        raise InvalidInputError('target must be "latin" or "cyrillic"')
+    transliterator = TO_LATIN_ISO9 if target == "latin" else TO_CYRILLIC_ISO9
+    transliterator.convert_file(src_path, dst_path, encoding, chunk_size)
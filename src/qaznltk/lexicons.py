@@ -0,0 +1,41 @@
+"""Bundled word lists, loaded lazily and shared by the whole process."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List
+
+from .exceptions import InvalidInputError, ResourceLoadError
+
+LEXICONS = ("stop_words", "positive_words", "negative_words")
+
+_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "special_words")
+_loaded: Dict[str, frozenset] = {}
+_lock = threading.Lock()
+
+
+def load_words(words_path: str) -> List[str]:
+    """Read a one-word-per-line file, skipping blank lines."""
+    try:
+        with open(words_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError) as e:
+        raise ResourceLoadError(f"Error while loading {words_path}: {e}") from e
+    return [word for word in map(str.strip, lines) if word]
+
+
+def get_lexicon(name: str) -> frozenset:
+    """Return a bundled word list (``"stop_words"``, ``"positive_words"`` or ``"negative_words"``).
+
+    The file is read on first use only; every caller shares the same frozenset.
+    """
+    words = _loaded.get(name)
+    if words is not None:
+        return words
+    if name not in LEXICONS:
+        raise InvalidInputError(f"Unknown lexicon {name!r}; available: {list(LEXICONS)}")
+    with _lock:
+        if name not in _loaded:
+            _loaded[name] = frozenset(load_words(os.path.join(_DIRECTORY, f"{name}.txt")))
+        return _loaded[name]
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from array import array
 from collections import Counter
+from itertools import zip_longest
 from math import exp, log
 
-from .utils import levenshtein_distance, normalize_text
+from .exceptions import InvalidInputError
+from .utils import imap_bounded, iter_chunks, levenshtein_distance, normalize_text
+
+# a text, or its tokens: a list of words or an array of Vocabulary token IDs
+TokensOrText = Union[str, Sequence[str], Sequence[int]]
+
 
 def calc_cer(true_text: str, pred_text: str) -> float:
     """Calculate Character Error Rate (CER)."""
@@ -15,30 +22,223 @@ def calc_cer(true_text: str, pred_text: str) -> float:
     return levenshtein_distance(true_text, pred_text) / len(true_text)
 
 
-def calc_wer(true_text: str, pred_text: str) -> float:
-    """Calculate Word Error Rate (WER)."""
-    true_text = normalize_text(true_text)
-    pred_text = normalize_text(pred_text)
-    true_words = tuple(true_text.split())
-    pred_words = tuple(pred_text.split())
-    if not true_words:
-        return 0.0 if not pred_words else 1.0
+def calc_wer(true_text: TokensOrText, pred_text: TokensOrText) -> float:
+    """Calculate Word Error Rate (WER).
+
+    Texts are normalized and split on whitespace; pre-tokenized inputs (lists
+    of words or ``Vocabulary.encode`` ID arrays) are compared as they are.
+    """
+    true_words = _words(true_text)
+    pred_words = _words(pred_text)
+    if not len(true_words):
+        return 0.0 if not len(pred_words) else 1.0
     return levenshtein_distance(true_words, pred_words) / len(true_words)
 
 
-def calc_levenshtein_distance(s1: str, s2: str) -> int:
-    """Convenience wrapper for Levenshtein distance."""
-    return levenshtein_distance(s1, s2)
+def _words(value: TokensOrText) -> Sequence:
+    return tuple(normalize_text(value).split()) if isinstance(value, str) else value
+
+
+def _error_rate(errors: int, length: int) -> float:
+    # ~ same convention as calc_cer/calc_wer for empty references
+    if not length:
+        return 0.0 if not errors else 1.0
+    return errors / length
+
+
+def _edit_operations(reference: Sequence, hypothesis: Sequence) -> Tuple[int, int, int]:
+    """Return ``(substitutions, deletions, insertions)`` of a minimal alignment."""
+    # ~ two DP rows; each cell carries the substitution and deletion counts of its best
+    # ~ alignment (insertions are the rest of the cost), so memory is linear in the hypothesis
+    cols = len(hypothesis) + 1
+    previous = list(range(cols))
+    previous_subs = [0] * cols
+    previous_dels = [0] * cols
+    for i, ref_item in enumerate(reference, 1):
+        current = [i] + [0] * (cols - 1)
+        current_subs = [0] * cols
+        current_dels = [i] + [0] * (cols - 1)
+        for j in range(1, cols):
+            mismatch = ref_item != hypothesis[j - 1]
+            diagonal = previous[j - 1] + mismatch
+            up = previous[j] + 1
+            left = current[j - 1] + 1
+            if diagonal <= up and diagonal <= left:
+                current[j] = diagonal
+                current_subs[j] = previous_subs[j - 1] + mismatch
+                current_dels[j] = previous_dels[j - 1]
+            elif up <= left:
+                current[j] = up
+                current_subs[j] = previous_subs[j]
+                current_dels[j] = previous_dels[j] + 1
+            else:
+                current[j] = left
+                current_subs[j] = current_subs[j - 1]
+                current_dels[j] = current_dels[j - 1]
+        previous, previous_subs, previous_dels = current, current_subs, current_dels
+
+    substitutions, deletions = previous_subs[-1], previous_dels[-1]
+    return substitutions, deletions, previous[-1] - substitutions - deletions
+
+
+_OPERATIONS = ("substitutions", "deletions", "insertions")
+
+
+def _evaluate_chunk(task: Tuple[List[Tuple[str, str]], bool, bool]) -> Tuple[Dict[str, int], List[Dict[str, float]]]:
+    # ~ process-pool worker: error totals (and optional details) for one chunk of pairs
+    pairs, per_utterance, operations = task
+    totals = Counter()
+    details = []
+    for true_text, pred_text in pairs:
+        true_chars = normalize_text(true_text)
+        pred_chars = normalize_text(pred_text)
+        true_words = tuple(true_chars.split())
+        pred_words = tuple(pred_chars.split())
+        if operations:
+            char_ops = _edit_operations(true_chars, pred_chars)
+            word_ops = _edit_operations(true_words, pred_words)
+            for name, char_count, word_count in zip(_OPERATIONS, char_ops, word_ops):
+                totals["char_" + name] += char_count
+                totals["word_" + name] += word_count
+            char_errors = sum(char_ops)
+            word_errors = sum(word_ops)
+        else:
+            char_errors = levenshtein_distance(true_chars, pred_chars, use_cache=False)
+            word_errors = levenshtein_distance(true_words, pred_words, use_cache=False)
+        totals["char_errors"] += char_errors
+        totals["char_length"] += len(true_chars)
+        totals["word_errors"] += word_errors
+        totals["word_length"] += len(true_words)
+        totals["utterances"] += 1
+        if per_utterance:
+            details.append(
+                {
+                    "cer": _error_rate(char_errors, len(true_chars)),
+                    "wer": _error_rate(word_errors, len(true_words)),
+                    "char_errors": char_errors,
+                    "word_errors": word_errors,
+                }
+            )
+    return totals, details
+
+
+_MISSING = object()
+
+
+def _aligned(references: Iterable, hypotheses: Iterable) -> Iterator[tuple]:
+    # ~ zip that raises instead of silently dropping the tail of the longer input
+    for index, (reference, hypothesis) in enumerate(zip_longest(references, hypotheses, fillvalue=_MISSING)):
+        if reference is _MISSING or hypothesis is _MISSING:
+            longer = "hypotheses" if reference is _MISSING else "references"
+            raise InvalidInputError(f"references and hypotheses differ in length: {longer} are longer ({index} pairs matched)")
+        yield reference, hypothesis
+
+
+def read_pairs(reference_path: str, hypothesis_path: Optional[str] = None, sep: str = "\t") -> Iterator[Tuple[str, str]]:
+    """Lazily read ``(reference, hypothesis)`` pairs.
+
+    With one path every line is ``reference<sep>hypothesis``; with two paths
+    the files are read line by line in parallel and must have the same number
+    of lines. Blank lines (in both files at once, with two paths) are skipped.
+    """
+    if hypothesis_path is None:
+        with open(reference_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if not line:
+                    continue
+                reference, _, hypothesis = line.partition(sep)
+                yield reference, hypothesis
+        return
+    with open(reference_path, "r", encoding="utf-8") as refs, open(hypothesis_path, "r", encoding="utf-8") as hyps:
+        for line_number, (reference, hypothesis) in enumerate(zip_longest(refs, hyps, fillvalue=None), 1):
+            if reference is None or hypothesis is None:
+                shorter = reference_path if reference is None else hypothesis_path
+                raise InvalidInputError(f"{shorter} ends at line {line_number - 1}, the other file has more lines")
+            reference = reference.rstrip("\r\n")
+            hypothesis = hypothesis.rstrip("\r\n")
+            if not reference and not hypothesis:
+                continue
+            yield reference, hypothesis
+
+
+def evaluate_corpus(
+    references: Union[Iterable[str], Iterable[Tuple[str, str]]],
+    hypotheses: Optional[Iterable[str]] = None,
+    n_jobs: int = 1,
+    chunksize: int = 1000,
+    per_utterance: bool = False,
+    operations: bool = False,
+) -> dict:
+    """
+    Compute micro-averaged corpus CER and WER.
+
+    Parameters
+    ----------
+    references : Iterable[str] or Iterable[Tuple[str, str]]
+        Reference texts, or ``(reference, hypothesis)`` pairs when
+        ``hypotheses`` is omitted (e.g. the output of ``read_pairs``).
+    hypotheses : Iterable[str], optional
+        Predicted texts aligned with ``references``; a length mismatch raises
+        ``InvalidInputError``.
+    n_jobs : int, default=1
+        Worker processes (``-1`` for all cores). Inputs are streamed in
+        chunks, so memory does not grow with the corpus.
+    chunksize : int, default=1000
+        Pairs per task.
+    per_utterance : bool, default=False
+        Also return per-pair ``cer``/``wer`` in input order.
+    operations : bool, default=False
+        Also count substitutions, deletions and insertions (uses an alignment
+        DP, which is slower than the distance-only path).
+
+    Returns
+    -------
+    dict
+        ``cer`` and ``wer`` are total edits / total reference length.
+    """
+    if hypotheses is None:
+        pairs = iter(references)
+    else:
+        pairs = _aligned(references, hypotheses)
+    tasks = ((chunk, per_utterance, operations) for chunk in iter_chunks(pairs, chunksize))
+
+    totals = Counter()
+    details = []
+    for chunk_totals, chunk_details in imap_bounded(_evaluate_chunk, tasks, n_jobs):
+        totals.update(chunk_totals)
+        details.extend(chunk_details)
+
+    result = {
+        "cer": _error_rate(totals["char_errors"], totals["char_length"]),
+        "wer": _error_rate(totals["word_errors"], totals["word_length"]),
+        "utterances": totals["utterances"],
+        "char_errors": totals["char_errors"],
+        "char_length": totals["char_length"],
+        "word_errors": totals["word_errors"],
+        "word_length": totals["word_length"],
+    }
+    if operations:
+        result["char_operations"] = {name: totals["char_" + name] for name in _OPERATIONS}
+        result["word_operations"] = {name: totals["word_" + name] for name in _OPERATIONS}
+    if per_utterance:
+        result["per_utterance"] = details
+    return result
+
 
-def _extract_ngrams(tokens: list[str], n: int) -> Counter:
+def calc_levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """Convenience wrapper for Levenshtein distance (``max_distance + 1`` once exceeded)."""
+    return levenshtein_distance(s1, s2, max_distance)
+
+def _extract_ngrams(tokens: Sequence, n: int) -> Counter:
     return Counter(
         tuple(tokens[i : i + n])
         for i in range(len(tokens) - n + 1)
     )
 
 def bleu_score(
-    reference: Sequence[str],
-    hypothesis: Sequence[str],
+    reference: Union[Sequence[str], Sequence[int]],
+    hypothesis: Union[Sequence[str], Sequence[int]],
     max_n: int = 4,
     smooth: bool = True,
 ) -> float:
@@ -47,10 +247,11 @@ def bleu_score(
 
     Parameters
     ----------
-    reference : Sequence[str]
-        Reference sentences.
-    hypothesis : Sequence[str]
-        Predicted sentences.
+    reference : Sequence[str] or Sequence[int]
+        Reference sentences, or the reference as one sequence of token IDs
+        (``Vocabulary.encode``, a NumPy array or a list of ints).
+    hypothesis : Sequence[str] or Sequence[int]
+        Predicted sentences, or token IDs from the same vocabulary.
     max_n : int, default=4
         Maximum n-gram order.
     smooth : bool, default=True
@@ -61,67 +262,161 @@ def bleu_score(
     float
         BLEU score in [0, 1].
     """
-    if not reference or not hypothesis:
+    if not len(reference) or not len(hypothesis):
         return 0.0
 
-    ref_tokens = [
-        token
-        for sentence in reference
-        for token in sentence.split()
-    ]
+    # sentences are concatenated, so n-grams may span sentence boundaries;
+    # use BleuAccumulator for sentence-aligned corpus BLEU
+    reference = _joined(reference, "reference")
+    hypothesis = _joined(hypothesis, "hypothesis")
+    return _bleu_from_stats(*_sentence_stats(reference, hypothesis, max_n), smooth)
 
-    hyp_tokens = [
-        token
-        for sentence in hypothesis
-        for token in sentence.split()
-    ]
 
-    if not hyp_tokens:
-        return 0.0
+def _joined(value: Union[Sequence[str], Sequence[int]], name: str) -> TokensOrText:
+    # token IDs (array, NumPy or a plain sequence of ints) are used as they are, sentences are joined
+    if isinstance(value, array) or hasattr(value, "__array_interface__"):
+        return value
+    if all(isinstance(item, str) for item in value):
+        return " ".join(value)
+    if all(isinstance(item, int) for item in value):
+        return value
+    raise InvalidInputError(f"{name} must be a sequence of sentences or a sequence of token IDs")
 
-    precisions = []
 
+def _sentence_stats(
+    reference: TokensOrText, hypothesis: TokensOrText, max_n: int
+) -> Tuple[List[int], List[int], int, int]:
+    # clipped n-gram matches and totals of one sentence pair, each n-gram Counter built once
+    ref_tokens = reference.split() if isinstance(reference, str) else reference
+    hyp_tokens = hypothesis.split() if isinstance(hypothesis, str) else hypothesis
+    matches = []
+    totals = []
     for n in range(1, max_n + 1):
         hyp_ngrams = _extract_ngrams(hyp_tokens, n)
+        if hyp_ngrams:
+            ref_ngrams = _extract_ngrams(ref_tokens, n)
+            matches.append(sum(min(count, ref_ngrams[ngram]) for ngram, count in hyp_ngrams.items()))
+        else:
+            matches.append(0)
+        totals.append(max(len(hyp_tokens) - n + 1, 0))
+    return matches, totals, len(ref_tokens), len(hyp_tokens)
 
-        if not hyp_ngrams:
-            precisions.append(1.0 if smooth else 0.0)
-            continue
-
-        ref_ngrams = _extract_ngrams(ref_tokens, n)
-
-        overlap = sum(
-            min(count, ref_ngrams[ngram])
-            for ngram, count in hyp_ngrams.items()
-        )
 
-        total = sum(hyp_ngrams.values())
+def _bleu_from_stats(
+    matches: Sequence[int], totals: Sequence[int], ref_len: int, hyp_len: int, smooth: bool
+) -> float:
+    if not hyp_len:
+        return 0.0
 
-        if smooth:
-            precision = (overlap + 1) / (total + 1)
+    precisions = []
+    for overlap, total in zip(matches, totals):
+        if not total:
+            precisions.append(1.0 if smooth else 0.0)
+        elif smooth:
+            precisions.append((overlap + 1) / (total + 1))
         else:
-            precision = overlap / total if total else 0.0
-
-        precisions.append(precision)
+            precisions.append(overlap / total)
 
     # Geometric mean
     if min(precisions) == 0:
         geo_mean = 0.0
     else:
-        geo_mean = exp(
-            sum(log(p) for p in precisions) / max_n
-        )
+        geo_mean = exp(sum(log(p) for p in precisions) / len(precisions))
 
     # Brevity penalty
-    ref_len = len(ref_tokens)
-    hyp_len = len(hyp_tokens)
+    bp = 1.0 if hyp_len > ref_len else exp(1 - ref_len / hyp_len)
+    return bp * geo_mean
 
-    if hyp_len == 0:
-        return 0.0
 
-    if hyp_len > ref_len:
-        bp = 1.0
-    else:
-        bp = exp(1 - ref_len / hyp_len)
+class BleuAccumulator:
+    """
+    Sufficient statistics for corpus BLEU over aligned sentence pairs.
+
+    Only the clipped n-gram match and total counts plus the reference and
+    hypothesis lengths are kept, so memory does not grow with the corpus.
+    Accumulators from different shards or processes combine with ``+``.
+
+    Parameters
+    ----------
+    max_n : int, default=4
+        Maximum n-gram order.
+    smooth : bool, default=True
+        Apply add-one smoothing, as in ``bleu_score``.
+    """
+
+    def __init__(self, max_n: int = 4, smooth: bool = True):
+        if max_n <= 0:
+            raise InvalidInputError("max_n must be positive")
+        self.max_n = max_n
+        self.smooth = smooth
+        self.matches = [0] * max_n
+        self.totals = [0] * max_n
+        self.ref_length = 0
+        self.hyp_length = 0
+        self.sentences = 0
+
+    def update(self, reference: TokensOrText, hypothesis: TokensOrText) -> "BleuAccumulator":
+        """Add one (reference, hypothesis) sentence pair, as texts or token sequences."""
+        matches, totals, ref_len, hyp_len = _sentence_stats(reference, hypothesis, self.max_n)
+        for n in range(self.max_n):
+            self.matches[n] += matches[n]
+            self.totals[n] += totals[n]
+        self.ref_length += ref_len
+        self.hyp_length += hyp_len
+        self.sentences += 1
+        return self
+
+    def update_batch(
+        self, references: Iterable[TokensOrText], hypotheses: Iterable[TokensOrText]
+    ) -> "BleuAccumulator":
+        """Add aligned sentence pairs from two iterables of the same length.
+
+        A length mismatch raises ``InvalidInputError`` once the shorter input
+        runs out; the pairs before it have already been added.
+        """
+        for reference, hypothesis in _aligned(references, hypotheses):
+            self.update(reference, hypothesis)
+        return self
 
-    return bp * geo_mean
\ No newline at end of file
+    def __iadd__(self, other: "BleuAccumulator") -> "BleuAccumulator":
+        if not isinstance(other, BleuAccumulator):
+            return NotImplemented
+        if (other.max_n, other.smooth) != (self.max_n, self.smooth):
+            raise InvalidInputError("cannot merge BLEU accumulators with different max_n or smooth")
+        for n in range(self.max_n):
+            self.matches[n] += other.matches[n]
+            self.totals[n] += other.totals[n]
+        self.ref_length += other.ref_length
+        self.hyp_length += other.hyp_length
+        self.sentences += other.sentences
+        return self
+
+    def __add__(self, other: "BleuAccumulator") -> "BleuAccumulator":
+        if not isinstance(other, BleuAccumulator):
+            return NotImplemented
+        merged = BleuAccumulator(self.max_n, self.smooth)
+        merged += self
+        merged += other
+        return merged
+
+    def score(self) -> float:
+        """Return the corpus BLEU score in [0, 1]."""
+        return _bleu_from_stats(self.matches, self.totals, self.ref_length, self.hyp_length, self.smooth)
+
+
+def sentence_bleu_batch(
+    references: Iterable[TokensOrText],
+    hypotheses: Iterable[TokensOrText],
+    max_n: int = 4,
+    smooth: bool = True,
+) -> List[float]:
+    """Return sentence-level BLEU for every aligned (reference, hypothesis) pair (texts or token sequences).
+
+    ``references`` and ``hypotheses`` must have the same length.
+    """
+    if max_n <= 0:
+        raise InvalidInputError("max_n must be positive")
+    return [
+        _bleu_from_stats(*_sentence_stats(reference, hypothesis, max_n), smooth)
+        for reference, hypothesis in _aligned(references, hypotheses)
+    ]
@@ -0,0 +1,209 @@
+"""MinHash signatures with banded LSH for near-duplicate detection."""
+
+from __future__ import annotations
+
+import random
+import zlib
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import InvalidInputError, UnsupportedFormatError
+from .qaznltk import QazNLTK
+from .storage import TermTable, open_sections, pack_terms, write_sections
+from .utils import normalize_text, tokenize_words
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class MinHashLSH:
+    """Near-duplicate index over character or word shingles.
+
+    Every text gets a ``num_perm`` MinHash signature split into ``bands``;
+    texts sharing any band are candidates, which are then verified with
+    ``QazNLTK.calc_similarity`` when a ``threshold`` is given. Hashes are
+    derived from CRC32 and a seeded permutation family, so signatures are
+    identical across processes and after ``save``/``load``.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle: str = "char",
+        shingle_size: int = 5,
+        threshold: Optional[float] = 0.8,
+        seed: int = 1,
+    ):
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise InvalidInputError("num_perm must be a positive multiple of bands")
+        if shingle not in ("char", "word") or shingle_size <= 0:
+            raise InvalidInputError('shingle must be "char" or "word" and shingle_size positive')
+        if threshold is not None and not 0 < threshold <= 1:
+            raise InvalidInputError("threshold must be in (0, 1]")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle = shingle
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.seed = seed
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self.keys: List[Hashable] = []
+        self.texts: List[str] = []
+        self.signatures = array("I")
+        self._positions: Dict[Hashable, int] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def shingles(self, text: str) -> set:
+        """Return the set of shingles of a normalized text."""
+        size = self.shingle_size
+        if self.shingle == "word":
+            tokens = tokenize_words(text)
+            if len(tokens) <= size:
+                return {" ".join(tokens)} if tokens else set()
+            return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+        if len(text) <= size:
+            return {text} if text else set()
+        return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+    def signature(self, text: str) -> array:
+        """Return the MinHash signature of a text (all ``2**32 - 1`` when it has no shingles)."""
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in self.shingles(normalize_text(text))]
+        if not hashes:
+            return array("I", [_MAX_HASH]) * self.num_perm
+        return array(
+            "I",
+            (min((a * value + b) % _MERSENNE_PRIME for value in hashes) & _MAX_HASH for a, b in self._permutations),
+        )
+
+    def insert(self, key: Hashable, text: str) -> None:
+        """Add a text under a unique key."""
+        if key in self._positions:
+            raise InvalidInputError(f"key {key!r} is already in the index")
+        self.__add(key, normalize_text(text), self.signature(text))
+
+    def query(self, text: str, threshold: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """Return ``(key, score)`` for indexed near-duplicates of ``text``, best first.
+
+        ``score`` is ``calc_similarity`` when a threshold is set (candidates
+        below it are dropped), otherwise the estimated shingle Jaccard.
+        """
+        return self.__query(normalize_text(text), self.signature(text), threshold)
+
+    def dedup(
+        self, items: Iterable[Union[str, Tuple[Hashable, str]]], threshold: Optional[float] = None
+    ) -> Iterator[Tuple[Hashable, Optional[Hashable]]]:
+        """Stream ``(key, duplicate_of)`` pairs, indexing every text that is not a duplicate.
+
+        Items are texts (keyed by their running position) or ``(key, text)`` pairs.
+        """
+        for position, item in enumerate(items):
+            key, text = item if isinstance(item, tuple) else (position, item)
+            normalized = normalize_text(text)
+            signature = self.signature(text)
+            matches = self.__query(normalized, signature, threshold)
+            if matches:
+                yield key, matches[0][0]
+            else:
+                self.__add(key, normalized, signature)
+                yield key, None
+
+    def __add(self, key: Hashable, normalized: str, signature: array) -> None:
+        position = len(self.keys)
+        self.keys.append(key)
+        self.texts.append(normalized)
+        self.signatures.extend(signature)
+        self._positions[key] = position
+        self.__index(position, signature)
+
+    def __index(self, position: int, signature: array) -> None:
+        if signature[0] == _MAX_HASH and signature.count(_MAX_HASH) == self.num_perm:
+            return
+        for band, bucket in enumerate(self._buckets):
+            start = band * self.rows
+            bucket.setdefault(signature[start : start + self.rows].tobytes(), []).append(position)
+
+    def __query(self, normalized: str, signature: array, threshold: Optional[float]) -> List[Tuple[Hashable, float]]:
+        if threshold is None:
+            threshold = self.threshold
+        candidates = set()
+        for band, bucket in enumerate(self._buckets):
+            start = band * self.rows
+            candidates.update(bucket.get(signature[start : start + self.rows].tobytes(), ()))
+
+        results = []
+        for position in candidates:
+            if threshold is None:
+                offset = position * self.num_perm
+                stored = self.signatures[offset : offset + self.num_perm]
+                score = sum(x == y for x, y in zip(signature, stored)) / self.num_perm
+            else:
+                score = QazNLTK.calc_similarity(normalized, self.texts[position])
+                if score < threshold:
+                    continue
+            results.append((position, score))
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return [(self.keys[position], score) for position, score in results]
+
+    def save(self, path: str) -> None:
+        """Write the index parameters, keys, texts and signatures to ``path``."""
+        key_types = {type(key) for key in self.keys}
+        if not key_types <= {int, str} or len(key_types) > 1:
+            raise InvalidInputError("only indexes with all-int or all-str keys can be saved")
+        key_offsets, key_blob = pack_terms([str(key) for key in self.keys])
+        text_offsets, text_blob = pack_terms(self.texts)
+        write_sections(
+            path,
+            {
+                "kind": "MinHashLSH",
+                "num_perm": self.num_perm,
+                "bands": self.bands,
+                "shingle": self.shingle,
+                "shingle_size": self.shingle_size,
+                "threshold": self.threshold,
+                "seed": self.seed,
+                "key_type": "int" if key_types == {int} else "str",
+            },
+            {
+                "key_offsets": key_offsets,
+                "key_blob": key_blob,
+                "text_offsets": text_offsets,
+                "text_blob": text_blob,
+                "signatures": self.signatures,
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "MinHashLSH":
+        """Load an index written by ``save``; band buckets are rebuilt from the signatures."""
+        meta, sections = open_sections(path)
+        if meta.get("kind") != "MinHashLSH":
+            raise UnsupportedFormatError(f"{path} does not contain a MinHashLSH index")
+        index = cls(
+            num_perm=meta["num_perm"],
+            bands=meta["bands"],
+            shingle=meta["shingle"],
+            shingle_size=meta["shingle_size"],
+            threshold=meta["threshold"],
+            seed=meta["seed"],
+        )
+        # ~ TermTable.term gives positional access to a packed string table
+        keys = TermTable(sections["key_offsets"], sections["key_blob"])
+        texts = TermTable(sections["text_offsets"], sections["text_blob"])
+        convert = int if meta["key_type"] == "int" else str
+        signatures = sections["signatures"]
+        for position in range(len(keys)):
+            offset = position * index.num_perm
+            signature = array("I", signatures[offset : offset + index.num_perm])
+            index.__add(convert(keys.term(position)), texts.term(position), signature)
+        return index
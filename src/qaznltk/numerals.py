@@ -0,0 +1,167 @@
+"""Kazakh numerals: table-driven ``num2word`` and a trie-based ``word2num`` parser."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import InvalidInputError
+
+UNITS = ("", "бір", "екі", "үш", "төрт", "бес", "алты", "жеті", "сегіз", "тоғыз")
+TENS = ("", "он", "жиырма", "отыз", "қырық", "елу", "алпыс", "жетпіс", "сексен", "тоқсан")
+HUNDRED = "жүз"
+SCALES = (
+    "", "мың", "миллион", "миллиард", "триллион", "квадриллион",
+    "квинтиллион", "секстиллион", "септиллион", "октиллион", "нониллион",
+)
+ZERO = "нөл"
+MINUS = "минус"
+MAX_ABS = 1000 ** len(SCALES) - 1
+
+# ~ phrases of the 0-999 triads, one table per scale, filled on first use
+_triads: List[Optional[List[str]]] = [None] * len(SCALES)
+
+
+def _render_triad(value: int, scale: int) -> str:
+    # Above the units group the scale word follows the hundreds and the tens
+    # as well whenever the units digit is zero (e.g. 110000 is
+    # "жүз мың он мың"); this keeps the output of the original algorithm.
+    hundreds, rest = divmod(value, 100)
+    tens, units = divmod(rest, 10)
+    word = SCALES[scale]
+    repeat = [word] if scale and not units else []
+    parts = []
+    if hundreds:
+        parts += ([UNITS[hundreds]] if hundreds > 1 else []) + [HUNDRED] + repeat
+    if tens:
+        parts += [TENS[tens]] + repeat
+    if units:
+        parts += [UNITS[units]] + ([word] if scale else [])
+    return " ".join(parts)
+
+
+def _triad_table(scale: int) -> List[str]:
+    table = _triads[scale]
+    if table is None:
+        table = _triads[scale] = [_render_triad(value, scale) for value in range(1000)]
+    return table
+
+
+def num2word(n: int) -> str:
+    """Spell an integer with ``abs(n) < 10**33`` in Kazakh words (``0`` gives ``""``)."""
+    if not isinstance(n, int):
+        raise InvalidInputError("n must be an integer")
+    rest = -n if n < 0 else n
+    if rest > MAX_ABS:
+        raise InvalidInputError(f"abs(n) must be below 10**{3 * len(SCALES)}")
+    parts = []
+    scale = 0
+    while rest:
+        rest, value = divmod(rest, 1000)
+        if value:
+            parts.append((_triads[scale] or _triad_table(scale))[value])
+        scale += 1
+    if n < 0:
+        parts.append(MINUS)
+    parts.reverse()
+    return " ".join(parts)
+
+
+def num2word_batch(numbers: Iterable[int]) -> List[str]:
+    """Spell many integers; triad phrases are shared across the whole batch."""
+    return [num2word(n) for n in numbers]
+
+
+# ~ word -> (kind, value); kinds: "unit", "tens", "hundred", "scale", "zero", "minus"
+_VOCABULARY: Dict[str, Tuple[str, int]] = {
+    **{word: ("unit", value) for value, word in enumerate(UNITS) if word},
+    **{word: ("tens", 10 * value) for value, word in enumerate(TENS) if word},
+    HUNDRED: ("hundred", 100),
+    **{word: ("scale", 1000**scale) for scale, word in enumerate(SCALES) if word},
+    ZERO: ("zero", 0),
+    MINUS: ("minus", -1),
+}
+_END = ""
+
+
+def _build_trie() -> dict:
+    trie: dict = {}
+    for word in _VOCABULARY:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = word
+    return trie
+
+
+_TRIE = _build_trie()
+
+
+@lru_cache(maxsize=4096)
+def _segment(token: str) -> Optional[Tuple[str, ...]]:
+    # split a token into numeral words, longest match first with backtracking,
+    # so run-together ASR output such as "жиырмабес" is understood too
+    if not token:
+        return ()
+    matches = []
+    node = _TRIE
+    for end, char in enumerate(token, 1):
+        node = node.get(char)
+        if node is None:
+            break
+        if _END in node:
+            matches.append(end)
+    for end in reversed(matches):
+        rest = _segment(token[end:])
+        if rest is not None:
+            return (token[:end],) + rest
+    return None
+
+
+def word2num(text: str) -> int:
+    """Parse a spelled-out Kazakh numeral (as produced by ``num2word`` or spoken) into an integer."""
+    if not isinstance(text, str):
+        raise InvalidInputError("text must be a string")
+    words = []
+    for token in text.lower().replace("-", " ").split():
+        segmented = _segment(token)
+        if segmented is None:
+            raise InvalidInputError(f"{token!r} is not a Kazakh numeral")
+        words.extend(segmented)
+    if not words:
+        raise InvalidInputError("text contains no numeral")
+
+    sign = 1
+    if words[0] == MINUS:
+        sign = -1
+        words = words[1:]
+        if not words:
+            raise InvalidInputError(f"no numeral follows the sign in {text!r}")
+    if words == [ZERO]:
+        return 0
+
+    total = 0
+    last_scale = None
+    hundreds = tens = units = None
+    for word in words:
+        kind, value = _VOCABULARY[word]
+        if kind == "unit" and units is None:
+            units = value
+        elif kind == "tens" and tens is None and units is None:
+            tens = value
+        elif kind == "hundred" and hundreds is None and tens is None:
+            hundreds = 100 * (units or 1)
+            units = None
+        elif kind == "scale" and (last_scale is None or value <= last_scale):
+            group = (hundreds or 0) + (tens or 0) + (units or 0)
+            total += (group or 1) * value
+            last_scale = value
+            hundreds = tens = units = None
+        else:
+            raise InvalidInputError(f"unexpected {word!r} in {text!r}")
+    return sign * (total + (hundreds or 0) + (tens or 0) + (units or 0))
+
+
+def word2num_batch(texts: Iterable[str]) -> List[int]:
+    """Parse many spelled-out numerals; token segmentations are cached across the batch."""
+    return [word2num(text) for text in texts]
@@ -1,27 +1,72 @@
-import os
-import re
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .cache import cached
 from .exceptions import InvalidInputError
+from .iin import IINBatch, get_info_from_iin_batch
+from .instrumentation import instrumented
 from .legacy import convert2cyrillic_iso9, convert2latin_iso9
+from .lexicons import get_lexicon, load_words
 from .metrics import calc_cer, calc_wer
-from .utils import compute_jaccard_similarity, frequency_tokens, levenshtein_distance, normalize_text, tokenize_words
+from .numerals import num2word, num2word_batch, word2num
+from .segmenter import SentenceSegmenter
+from .sentiment import SentimentLexicon, SentimentResult, sentimize_batch
+from .similarity import calc_similarity_matrix, find_similar_pairs
+from .tokenizer import Tokenizer
+from .utils import compute_jaccard_similarity, levenshtein_distance, normalize_text
+
+_segmenter = SentenceSegmenter()
 
 class QazNLTK:
     def __init__(cls) -> None:
-        base = os.path.join(os.path.dirname(os.path.abspath(__file__)), "special_words")
-        cls.stop_words = set(cls.load_words(f"{base}/stop_words.txt"))
-        cls.positive_words = set(cls.load_words(f"{base}/positive_words.txt"))
-        cls.negative_words = set(cls.load_words(f"{base}/negative_words.txt"))
+        # word lists are copied from the shared, lazily loaded lexicons on first access
+        cls._words: Dict[str, set] = {}
+        cls._tokenizer: Optional[Tokenizer] = None
+        cls._lexicons: Dict[bool, Tuple[frozenset, frozenset, SentimentLexicon]] = {}
 
     @staticmethod
     def load_words(words_path: str) -> List[str]:
-        try:
-            with open(words_path, "r", encoding="utf-8") as f:
-                return [w.strip() for w in f.readlines() if w.strip()]
-        except Exception as e:
-            print(f"Error while loading {words_path}: {e}")
-            return []
+        return load_words(words_path)
+
+    def _lexicon(self, name: str) -> set:
+        words = self._words.get(name)
+        if words is None:
+            words = self._words[name] = set(get_lexicon(name))
+        return words
+
+    @property
+    def stop_words(self) -> set:
+        return self._lexicon("stop_words")
+
+    @stop_words.setter
+    def stop_words(self, words: Iterable[str]) -> None:
+        self._words["stop_words"] = set(words)
+        self._tokenizer = None
+        # cached token counts were filtered with the old stop words
+        self._token_counts.cache_clear()
+
+    @property
+    def positive_words(self) -> set:
+        return self._lexicon("positive_words")
+
+    @positive_words.setter
+    def positive_words(self, words: Iterable[str]) -> None:
+        self._words["positive_words"] = set(words)
+        self._lexicons.clear()
+
+    @property
+    def negative_words(self) -> set:
+        return self._lexicon("negative_words")
+
+    @negative_words.setter
+    def negative_words(self, words: Iterable[str]) -> None:
+        self._words["negative_words"] = set(words)
+        self._lexicons.clear()
+
+    @property
+    def tokenizer(self) -> Tokenizer:
+        if self._tokenizer is None:
+            self._tokenizer = Tokenizer(self.stop_words)
+        return self._tokenizer
 
     def get_stop_words(cls) -> List[str]:
         return sorted(list(cls.stop_words))
@@ -38,12 +83,23 @@ class QazNLTK:
     def convert2cyrillic_iso9(cls, text: str) -> str:
         return convert2cyrillic_iso9(text)
 
-    def tokenize(self, text: str) -> List[tuple]:
+    @instrumented("tokenize", size=lambda self, text, *args, **kwargs: len(text))
+    def tokenize(self, text: str, top_k: Optional[int] = None, use_cache: bool = True) -> List[tuple]:
         if not isinstance(text, str):
             raise InvalidInputError("text must be a string")
-        tokens = [token for token in tokenize_words(text) if token not in self.stop_words]
-        return frequency_tokens(tokens)
+        # the cache holds tuples; every caller gets its own list
+        return list(self._token_counts(text, top_k, use_cache=use_cache))
+
+    # opt-in: enable with configure_cache("tokenize", maxsize=...)
+    @cached("tokenize", maxsize=0)
+    def _token_counts(self, text: str, top_k: Optional[int]) -> Tuple[tuple, ...]:
+        return tuple(self.tokenizer.most_common(text, top_k))
+
+    def iter_tokens(self, source) -> Iterator[str]:
+        """Lazily yield stop-word-filtered tokens from a string, file-like object or text chunks."""
+        return self.tokenizer.iter_tokens(source)
 
+    @instrumented("sentimize", size=lambda self, text: len(text))
     def sentimize(self, text) -> float:
         if isinstance(text, str):
             tokens = self.tokenize(text)
@@ -64,7 +120,29 @@ class QazNLTK:
             return -1.0
         return 0.0
 
+    def sentimize_batch(
+        self, texts: Iterable[str], n_jobs: int = 1, chunksize: int = 1000, inflections: bool = True
+    ) -> Iterator[SentimentResult]:
+        """Lazily score many texts, yielding ``(label, positive, negative)`` per text.
+
+        With ``inflections=True`` inflected forms of lexicon words are matched
+        through a stem/suffix trie, so the label may differ from ``sentimize``.
+        """
+        return sentimize_batch(texts, self.tokenizer, self._sentiment_lexicon(inflections), n_jobs, chunksize)
+
+    def _sentiment_lexicon(self, inflections: bool) -> SentimentLexicon:
+        # compiled once per inflections flag and kept while the word lists are unchanged;
+        # comparing against a snapshot also catches in-place edits of the sets
+        inflections = bool(inflections)
+        positive, negative = self.positive_words, self.negative_words
+        compiled = self._lexicons.get(inflections)
+        if compiled is None or compiled[0] != positive or compiled[1] != negative:
+            lexicon = SentimentLexicon(positive, negative, inflections=inflections)
+            compiled = self._lexicons[inflections] = (frozenset(positive), frozenset(negative), lexicon)
+        return compiled[2]
+
     @staticmethod
+    @instrumented("calc_similarity", size=lambda text_a, text_b: len(text_a) + len(text_b))
     def calc_similarity(text_a: str, text_b: str) -> float:
         if not isinstance(text_a, str) or not isinstance(text_b, str):
             raise InvalidInputError("text_a and text_b must be strings")
@@ -82,6 +160,16 @@ class QazNLTK:
         sim_score = float(max(0.0, min(1.0, similarity)))
         return sim_score
     
+    @staticmethod
+    def calc_similarity_matrix(texts_a: List[str], texts_b: Optional[List[str]] = None, n_jobs: int = 1) -> List[List[float]]:
+        return calc_similarity_matrix(texts_a, texts_b, n_jobs)
+
+    @staticmethod
+    def find_similar_pairs(
+        texts_a: List[str], texts_b: Optional[List[str]] = None, threshold: float = 0.8, n_jobs: int = 1
+    ) -> List[tuple]:
+        return find_similar_pairs(texts_a, texts_b, threshold, n_jobs)
+    
     @staticmethod
     def calc_cer(true_text: str, pred_text: str) -> float:
         return calc_cer(true_text, pred_text)
@@ -92,95 +180,29 @@ class QazNLTK:
 
     @staticmethod
     def sent_tokenize(text: str) -> List[str]:
-        if not isinstance(text, str):
-            raise InvalidInputError("text must be a string")
-        return re.split(r'(?<=[.!?]) +', text)
+        return _segmenter.segment(text)
+
+    @staticmethod
+    def iter_sentences(source) -> Iterator[str]:
+        """Lazily yield sentences from a string, file-like object or text chunks in constant memory."""
+        return _segmenter.iter_sentences(source)
     
     @staticmethod
     def get_kaz_alphabet() -> List[str]:
         return list("аәбвгғдеёжзийкқлмнңоөпрстуүұфхһцчшщъыіьэюя")
 
     @staticmethod
+    @cached("num2word", maxsize=4096)
     def num2word(n: int) -> str:
-        # Convert number to word
-        w = {
-            "1": "бір",
-            "2": "екі",
-            "3": "үш",
-            "4": "төрт",
-            "5": "бес",
-            "6": "алты",
-            "7": "жеті",
-            "8": "сегіз",
-            "9": "тоғыз",
-            "10": 'он',
-            "20": "жиырма",
-            "30": "отыз",
-            "40": "қырық",
-            "50": "елу",
-            "60": "алпыс",
-            "70": "жетпіс",
-            "80": "сексен",
-            "90": "тоқсан"
-        }
-        mp = {
-            0: "нөл",
-            1: "он",
-            2: "жүз",
-            3: "мың",
-            6: "миллион",
-            9: "миллиард",
-            12: "триллион",
-            15: "квадриллион",
-            18: "квинтиллион",
-            21: "секстиллион",
-            24: "септиллион",
-            27: "октиллион",
-            30: "нониллион"
-        }
-        s = str(n)
-        v = []
-        c = []
-        cur = ''
-
-        for i in range(len(s) - 1, -1, -1):
-            if i == len(s) - 1:
-                if s[i] > '0':
-                    v.append(w[s[i]])
-                continue
-            x = len(s) - i - 1
-            if x in mp:
-                if x == 1:
-                    if s[i] > '0':
-                        cur = w[s[i] + '0']
-                else:
-                    cur = mp[x]
-            else:
-                if x % 3 == 1:
-                    if s[i] > '0':
-                        cur = w[s[i] + '0']
-                    if mp[x - x % 3] not in c:
-                        cur += ' '
-                        cur += mp[x - x % 3]
-                else:
-                    cur = mp[x % 3]
-                    if mp[x - x % 3] not in c:
-                        cur += ' '
-                        cur += mp[x - x % 3]
-                        c.append(mp[x - x % 3])
-            if s[i] > '0':
-                c.append(cur)
-                v.append(cur)
-                if x % 3 == 2 and s[i] < '2':
-                    continue
-                if x % 3 != 1:
-                    v.append(w[s[i]])
-
-        if n < 0:
-            v.append('минус')
-
-        v.reverse()
-        return ' '.join(v)
+        return num2word(n)
+
+    @staticmethod
+    def num2word_batch(numbers: Iterable[int]) -> List[str]:
+        return num2word_batch(numbers)
+
+    @staticmethod
+    def word2num(text: str) -> int:
+        return word2num(text)
 
     @staticmethod
     def get_info_from_iin(iin: str) -> dict:
@@ -228,4 +250,9 @@ class QazNLTK:
             "gender": gender,
             "sequence_number": sequence_number,
             "control_discharge": control_discharge,
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def get_info_from_iin_batch(iins) -> IINBatch:
+        """Validate and decode many IINs at once into columns (see ``qaznltk.iin``)."""
+        return get_info_from_iin_batch(iins)
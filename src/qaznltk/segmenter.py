@@ -0,0 +1,160 @@
+"""Streaming sentence segmenter with Kazakh abbreviation handling."""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
+
+from .exceptions import InvalidInputError
+
+Source = Union[str, TextIO, Iterable[str]]
+
+# written without the final period, compared lower-cased
+ABBREVIATIONS = frozenset(
+    {
+        # тағы басқа, тағы сол сияқты, тағы тағы, біздің заманымызға дейін / заманымыз
+        "т.б", "т.с.с", "т.с", "т.т", "б.з.б", "б.з", "т.б.с",
+        # жыл, жылдар, ғасыр, ғасырлар, бет, беттер, том, тармақ
+        "ж", "жж", "ғ", "ғғ", "б", "бб", "т", "тарм",
+        # қала, облыс, аудан, пәтер, сағат, нөмір
+        "қ", "обл", "ауд", "пәт", "сағ", "нөм", "№",
+        # units and amounts
+        "млн", "млрд", "трлн", "км", "см", "мм", "кг", "гр", "тг",
+        # titles and degrees
+        "проф", "акад", "доц", "ғыл", "қызм", "т.ғ.д", "т.ғ.к", "ф.ғ.д", "ф.ғ.к",
+        "э.ғ.д", "э.ғ.к", "п.ғ.д", "п.ғ.к", "з.ғ.д", "з.ғ.к", "м.ғ.д", "м.ғ.к",
+        # common in Russian-language passages of Kazakh text
+        "г", "гг", "т.д", "т.п", "др", "им", "ул", "д", "стр", "руб",
+        "etc", "e.g", "i.e", "vs", "mr", "mrs", "dr",
+    }
+)
+# abbreviations that are also ordinary words (үй "house", қар "snow", мың "thousand", ...);
+# they only continue the sentence when a lower-case word or a digit follows
+AMBIGUOUS_ABBREVIATIONS = frozenset(
+    {
+        "үй", "қар", "мың", "аға", "шам", "тар", "ау", "бап", "мин", "сек",
+        "мыс", "көш", "даң", "тыс", "текше",
+    }
+)
+# abbreviations that often close a sentence; they end one when a capital letter follows
+SENTENCE_FINAL = frozenset({"т.б", "т.с.с", "т.с", "т.т", "т.д", "т.п", "etc"})
+
+# ~ terminal punctuation, closing quotes/brackets, then whitespace before the next sentence;
+# ~ a period inside a token (1.5, т.б, www.gov.kz) is never followed by whitespace
+_BOUNDARY = re.compile(r"([.!?…]+)([\"'»”’)\]]*)\s+(?=(\S))")
+_OPENING = "\"'«“‘(["
+_TAIL = ".!?…\"'»”’)]"
+# ~ abbreviations and initials are short; longer words are never looked up
+_MAX_WORD = 16
+_INITIALS = re.compile(r"(?:[^\W\d_]\.)*[^\W\d_]")
+
+
+class SentenceSegmenter:
+    """Rule-based sentence splitter that also works on streams.
+
+    A sentence ends at ``.``, ``!``, ``?`` or an ellipsis followed by
+    whitespace, except after an abbreviation (``т.б.``, ``ж.``, ``проф.``),
+    after an abbreviation that is also a word (``мың.``, ``үй.``) when a
+    lower-case word or a digit follows, after initials (``А. Байтұрсынұлы``) and at an ellipsis followed by a
+    lower-case word. Sentences are stripped of surrounding whitespace.
+    """
+
+    def __init__(
+        self,
+        abbreviations: Optional[Iterable[str]] = None,
+        chunk_size: int = 1 << 16,
+        ambiguous_abbreviations: Optional[Iterable[str]] = None,
+    ):
+        if chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be positive")
+        if abbreviations is None:
+            abbreviations = ABBREVIATIONS
+        if ambiguous_abbreviations is None:
+            ambiguous_abbreviations = AMBIGUOUS_ABBREVIATIONS
+        self.abbreviations = frozenset(word.lower().rstrip(".") for word in abbreviations)
+        self.ambiguous_abbreviations = frozenset(word.lower().rstrip(".") for word in ambiguous_abbreviations)
+        self.chunk_size = chunk_size
+
+    def segment(self, text: str) -> List[str]:
+        if not isinstance(text, str):
+            raise InvalidInputError("text must be a string")
+        sentences = []
+        start = self.__split(text, 0, sentences.append)
+        last = text[start:].strip()
+        if last:
+            sentences.append(last)
+        return sentences
+
+    def iter_sentences(self, source: Source) -> Iterator[str]:
+        """Lazily yield sentences from a string, a file-like object or an iterable of text chunks.
+
+        The unfinished sentence at the end of a chunk is carried into the
+        next one, so memory is bounded by the longest sentence and the output
+        equals ``segment`` of the joined input.
+        """
+        if isinstance(source, str):
+            yield from self.segment(source)
+            return
+        if hasattr(source, "read"):
+            chunk_size = self.chunk_size
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = iter(source)
+
+        carry = ""
+        resume = 0
+        sentences: List[str] = []
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise InvalidInputError("text chunks must be strings")
+            buffer = carry + chunk
+            start = self.__split(buffer, resume, sentences.append)
+            yield from sentences
+            sentences.clear()
+            carry = buffer[start:]
+            resume = _resume_position(carry)
+        last = carry.strip()
+        if last:
+            yield last
+
+    def __split(self, text: str, pos: int, emit) -> int:
+        # emit every complete sentence of text, scanning from pos; return where the rest begins
+        start = 0
+        for match in _BOUNDARY.finditer(text, pos):
+            end = match.start()
+            if not self.__is_boundary(_word_before(text, end, start), match.group(1), match.group(3)):
+                continue
+            sentence = text[start : match.end(2)].strip()
+            if sentence:
+                emit(sentence)
+            start = match.end()
+        return start
+
+    def __is_boundary(self, word: str, punctuation: str, following: str) -> bool:
+        word = word.lstrip(_OPENING)
+        if punctuation == ".":
+            key = word.lower()
+            if key in self.abbreviations:
+                return key in SENTENCE_FINAL and following.isupper()
+            if key in self.ambiguous_abbreviations:
+                return not (following.islower() or following.isdigit())
+            if word[:1].isupper() and _INITIALS.fullmatch(word):
+                return False
+        elif punctuation in ("...", "…") and following.islower():
+            return False
+        return True
+
+
+def _word_before(text: str, end: int, start: int) -> str:
+    begin = max(start, end - _MAX_WORD - 1)
+    tail = text[begin:end]
+    if not tail or tail[-1].isspace():
+        return ""
+    word = tail.split()[-1]
+    # ~ a word filling the whole window may be longer than it
+    return "" if len(word) > _MAX_WORD else word
+
+
+def _resume_position(carry: str) -> int:
+    # ~ only the trailing punctuation run can still become a boundary once more text arrives
+    return len(carry.rstrip().rstrip(_TAIL))
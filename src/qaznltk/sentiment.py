@@ -0,0 +1,174 @@
+"""Compiled sentiment lexicon with inflection-aware matching and batch scoring."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from .tokenizer import Tokenizer
+from .utils import imap_bounded, iter_chunks, resolve_n_jobs
+
+# Common Kazakh inflectional and derivational suffixes (all vowel-harmony and
+# assimilation variants); an inflected form is a lexicon stem followed by a
+# chain of these. Single-letter suffixes (-м, -ң, -н, -а, -ы, -п, -у, ...) are
+# left out: chains of them would let unrelated words match a lexicon stem.
+KAZAKH_SUFFIXES = frozenset(
+    """
+    лар лер дар дер тар тер
+    ым ім ың ің ңыз ңіз ыңыз іңіз сы сі мыз міз ымыз іміз
+    ның нің дың дің тың тің ға ге қа ке на не ны ні ды ді ты ті
+    да де та те нда нде дан ден тан тен нан нен мен бен пен ша ше
+    мын мін бын бін пын пін сың сің быз біз пыз піз
+    ған ген қан кен атын етін йтын йтін ып іп са се
+    мақ мек бақ бек пақ пек ғы гі қы кі шы ші
+    лық лік дық дік тық тік лы лі дай дей тай тей ғыш гіш қыш кіш
+    шақ шек рақ рек ырақ ірек
+    """.split()
+)
+# The privative -сыз/-сіз and the verb negation -ма/-ме/-ба/-бе/-па/-пе reverse
+# the meaning of the stem (пайдасыз "useless", сүймеймін "I do not love"): each
+# one in the chain inverts the stem's polarity.
+NEGATING_SUFFIXES = frozenset("сыз сіз ма ме ба бе па пе".split())
+_MAX_SUFFIX_LENGTH = max(len(suffix) for suffix in KAZAKH_SUFFIXES | NEGATING_SUFFIXES)
+_TERMINAL = ""
+
+
+class SentimentResult(NamedTuple):
+    label: float
+    positive: int
+    negative: int
+
+
+@lru_cache(maxsize=65536)
+def _suffix_chain_sign(rest: str) -> int:
+    # 1 if rest is a chain of suffixes keeping the stem's polarity, -1 if it inverts it, 0 if not a chain
+    if not rest:
+        return 1
+    for size in range(1, min(_MAX_SUFFIX_LENGTH, len(rest)) + 1):
+        suffix = rest[:size]
+        negating = suffix in NEGATING_SUFFIXES
+        if negating or suffix in KAZAKH_SUFFIXES:
+            sign = _suffix_chain_sign(rest[size:])
+            if sign:
+                return -sign if negating else sign
+    return 0
+
+
+class SentimentLexicon:
+    """Positive/negative lexicon compiled for fast token polarity lookups.
+
+    Exact matches come from a single dict. With ``inflections=True`` other
+    tokens are matched against the longest lexicon stem (from a character
+    trie) whose remainder is a chain of ``KAZAKH_SUFFIXES``, so inflected
+    forms need no lemmatization. Every ``NEGATING_SUFFIXES`` member of the
+    chain inverts the stem's polarity, so ``пайдасыз`` is negative when
+    ``пайда`` is positive. Positive wins when a word is in both lists, as in
+    ``QazNLTK.sentimize``.
+    """
+
+    def __init__(
+        self,
+        positive_words: Iterable[str],
+        negative_words: Iterable[str],
+        inflections: bool = True,
+        min_stem_length: int = 3,
+        memo_size: int = 1 << 18,
+    ):
+        self.inflections = inflections
+        self.min_stem_length = min_stem_length
+        self.memo_size = memo_size
+        self._exact: Dict[str, int] = {word: -1 for word in negative_words}
+        self._exact.update((word, 1) for word in positive_words)
+        self._trie: dict = {}
+        for word, polarity in self._exact.items():
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = polarity
+        self._memo: Dict[str, int] = {}
+
+    def polarity(self, token: str) -> int:
+        """Return ``1`` for positive, ``-1`` for negative and ``0`` for unknown tokens."""
+        polarity = self._exact.get(token)
+        if polarity is not None:
+            return polarity
+        if not self.inflections:
+            return 0
+        polarity = self._memo.get(token)
+        if polarity is not None:
+            return polarity
+
+        polarity = 0
+        node = self._trie
+        for end, char in enumerate(token, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if _TERMINAL in node and end >= self.min_stem_length:
+                sign = _suffix_chain_sign(token[end:])
+                if sign:
+                    polarity = sign * node[_TERMINAL]
+
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[token] = polarity
+        return polarity
+
+    def __getstate__(self) -> dict:
+        # the memo is a per-process cache; do not ship it to pool workers
+        state = self.__dict__.copy()
+        state["_memo"] = {}
+        return state
+
+    def score(self, token_counts: Iterable[Tuple[str, int]]) -> SentimentResult:
+        """Score ``(token, frequency)`` pairs into a label plus raw counts."""
+        positive = negative = 0
+        polarity = self.polarity
+        for token, freq in token_counts:
+            value = polarity(token)
+            if value > 0:
+                positive += freq
+            elif value < 0:
+                negative += freq
+        if positive > negative:
+            return SentimentResult(1.0, positive, negative)
+        if positive < negative:
+            return SentimentResult(-1.0, positive, negative)
+        return SentimentResult(0.0, positive, negative)
+
+
+# per-process scorer, installed once by the pool initializer
+_worker: Optional[Tuple[Tokenizer, SentimentLexicon]] = None
+
+
+def _init_worker(tokenizer: Tokenizer, lexicon: SentimentLexicon) -> None:
+    global _worker
+    _worker = (tokenizer, lexicon)
+
+
+def _score_chunk(texts: list) -> list:
+    tokenizer, lexicon = _worker
+    return [lexicon.score(tokenizer.count(text).items()) for text in texts]
+
+
+def sentimize_batch(
+    texts: Iterable[str],
+    tokenizer: Tokenizer,
+    lexicon: SentimentLexicon,
+    n_jobs: int = 1,
+    chunksize: int = 1000,
+) -> Iterator[SentimentResult]:
+    """Lazily yield a ``SentimentResult`` per text, in input order."""
+    if resolve_n_jobs(n_jobs) == 1:
+        for text in texts:
+            yield lexicon.score(tokenizer.count(text).items())
+        return
+    results = imap_bounded(
+        _score_chunk,
+        iter_chunks(texts, chunksize),
+        n_jobs,
+        initializer=_init_worker,
+        initargs=(tokenizer, lexicon),
+    )
+    for chunk in results:
+        yield from chunk
@@ -0,0 +1,180 @@
+"""Many-to-many text similarity with cheap candidate pruning."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .exceptions import InvalidInputError
+from .utils import levenshtein_distance, normalize_text, process_pool, resolve_n_jobs, split_evenly
+
+_popcount = getattr(int, "bit_count", None) or (lambda value: bin(value).count("1"))
+
+# ~ (normalized text, character-set bitmask, number of distinct characters)
+_Prepared = Tuple[str, int, int]
+
+# ~ per-process column data, installed once by the pool initializer
+_columns: List[_Prepared] = []
+
+
+def calc_similarity_matrix(
+    texts_a: Sequence[str], texts_b: Optional[Sequence[str]] = None, n_jobs: int = 1
+) -> List[List[float]]:
+    """Return ``calc_similarity`` for every pair of ``texts_a`` x ``texts_b``.
+
+    With a single list the matrix is symmetric and only one triangle is
+    computed. Each text is normalized once.
+    """
+    rows, columns = _prepare_all(texts_a, texts_b)
+    symmetric = texts_b is None
+    tasks = [(chunk, None, symmetric) for chunk in _row_chunks(len(rows), n_jobs)]
+    results = _run(tasks, rows, columns, n_jobs)
+    matrix = [row for chunk in results for row in chunk]
+    if symmetric:
+        for i in range(len(matrix)):
+            for j in range(i):
+                matrix[i][j] = matrix[j][i]
+    return matrix
+
+
+def find_similar_pairs(
+    texts_a: Sequence[str],
+    texts_b: Optional[Sequence[str]] = None,
+    threshold: float = 0.8,
+    n_jobs: int = 1,
+) -> List[Tuple[int, int, float]]:
+    """Return every ``(i, j, score)`` with ``calc_similarity >= threshold``.
+
+    With a single list only pairs ``i < j`` are reported, which makes it a
+    deduplication primitive. Candidates are pruned with a character-set
+    bitmask Jaccard and a length bound before any Levenshtein distance is
+    computed, and the distance itself stops early once the pair cannot reach
+    ``threshold``.
+    """
+    if not 0 < threshold <= 1:
+        raise InvalidInputError("threshold must be in (0, 1]")
+    rows, columns = _prepare_all(texts_a, texts_b)
+    tasks = [(chunk, threshold, texts_b is None) for chunk in _row_chunks(len(rows), n_jobs)]
+    results = _run(tasks, rows, columns, n_jobs)
+    return [pair for chunk in results for pair in chunk]
+
+
+def _prepare_all(texts_a: Sequence[str], texts_b: Optional[Sequence[str]]) -> Tuple[List[_Prepared], List[_Prepared]]:
+    bits: Dict[str, int] = {}
+    rows = [_prepare(text, bits) for text in texts_a]
+    columns = rows if texts_b is None else [_prepare(text, bits) for text in texts_b]
+    return rows, columns
+
+
+def _prepare(text: str, bits: Dict[str, int]) -> _Prepared:
+    if not isinstance(text, str):
+        raise InvalidInputError("texts must be strings")
+    normalized = normalize_text(text)
+    mask = 0
+    for char in set(normalized):
+        bit = bits.get(char)
+        if bit is None:
+            bit = bits[char] = len(bits)
+        mask |= 1 << bit
+    return normalized, mask, _popcount(mask)
+
+
+def _row_chunks(num_rows: int, n_jobs: int) -> List[range]:
+    # ~ several chunks per worker keep the pool balanced on the symmetric triangle
+    workers = resolve_n_jobs(n_jobs)
+    return split_evenly(range(num_rows), workers * 4 if workers > 1 else 1)
+
+
+def _run(tasks: list, rows: List[_Prepared], columns: List[_Prepared], n_jobs: int) -> list:
+    workers = resolve_n_jobs(n_jobs)
+    if workers == 1 or len(tasks) <= 1:
+        return [
+            _score_rows([rows[i] for i in chunk], chunk, threshold, symmetric, columns)
+            for chunk, threshold, symmetric in tasks
+        ]
+    with process_pool(workers, _init_columns, (columns,)) as pool:
+        futures = [
+            pool.submit(_score_rows, [rows[i] for i in chunk], chunk, threshold, symmetric)
+            for chunk, threshold, symmetric in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def _init_columns(columns: List[_Prepared]) -> None:
+    global _columns
+    _columns = columns
+
+
+def _score(a: _Prepared, b: _Prepared, max_distance: Optional[int] = None) -> Optional[float]:
+    # ~ same arithmetic as QazNLTK.calc_similarity; None when max_distance is exceeded
+    text_a, mask_a, count_a = a
+    text_b, mask_b, count_b = b
+    if not text_a or not text_b:
+        return 0.0
+    intersection = _popcount(mask_a & mask_b)
+    union = count_a + count_b - intersection
+    jaccard_similarity = intersection / union if union else 0.0
+    distance = levenshtein_distance(text_a, text_b, max_distance, use_cache=False)
+    if max_distance is not None and distance > max_distance:
+        return None
+    if distance == 0:
+        return 1.0
+    similarity = (jaccard_similarity + (1 / (distance + 1))) / 2
+    return float(max(0.0, min(1.0, similarity)))
+
+
+def _score_rows(
+    rows: List[_Prepared],
+    row_ids: range,
+    threshold: Optional[float],
+    symmetric: bool,
+    columns: Optional[List[_Prepared]] = None,
+) -> list:
+    if columns is None:
+        columns = _columns
+    if threshold is None:
+        result = []
+        for row_id, row in zip(row_ids, rows):
+            scores = [0.0] * len(columns)
+            for col_id in range(row_id if symmetric else 0, len(columns)):
+                scores[col_id] = _score(row, columns[col_id])
+            result.append(scores)
+        return result
+
+    # ~ (J + 1/(d + 1)) / 2 >= t with J <= 1 and d >= |len_a - len_b| bounds the length gap for t > 0.5
+    order = sorted(range(len(columns)), key=lambda col_id: len(columns[col_id][0]))
+    lengths = [len(columns[col_id][0]) for col_id in order]
+    max_gap = math.floor(1 / (2 * threshold - 1) - 1) + 1 if threshold > 0.5 else None
+
+    pairs = []
+    for row_id, row in zip(row_ids, rows):
+        text_a, mask_a, count_a = row
+        if not text_a:
+            continue
+        if max_gap is None:
+            candidates = order
+        else:
+            lo = bisect_left(lengths, len(text_a) - max_gap)
+            hi = bisect_right(lengths, len(text_a) + max_gap)
+            candidates = order[lo:hi]
+        for col_id in candidates:
+            if symmetric and col_id <= row_id:
+                continue
+            column = columns[col_id]
+            text_b, mask_b, count_b = column
+            if not text_b:
+                continue
+            intersection = _popcount(mask_a & mask_b)
+            jaccard_similarity = intersection / (count_a + count_b - intersection)
+            gap = abs(len(text_a) - len(text_b))
+            if text_a != text_b and (jaccard_similarity + 1 / (gap + 1)) / 2 < threshold:
+                continue
+            # ~ 1/(d + 1) >= 2t - J gives the largest distance that can still pass
+            needed = 2 * threshold - jaccard_similarity
+            max_distance = int(1 / needed - 1) + 1 if needed > 0 else None
+            score = _score(row, column, max_distance)
+            if score is not None and score >= threshold:
+                pairs.append((row_id, col_id, score))
+    pairs.sort(key=lambda pair: (pair[0], pair[1]))
+    return pairs
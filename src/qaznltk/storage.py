@@ -0,0 +1,151 @@
+"""Compact binary storage with memory-mapped loading for fitted models."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, Sequence, Tuple, Union
+
+from .exceptions import ResourceLoadError, UnsupportedFormatError
+
+MAGIC = b"QAZNLTK\x00"
+FORMAT_VERSION = 1
+_ALIGNMENT = 8
+
+Buffer = Union[array, bytes, memoryview]
+
+
+def write_sections(path: str, meta: dict, sections: Dict[str, Buffer]) -> None:
+    """Write typed array sections plus a JSON ``meta`` header to ``path``.
+
+    Layout: magic, little-endian ``uint32`` header length, UTF-8 JSON header,
+    then every section aligned to 8 bytes in native byte order.
+    """
+    layout = {}
+    offset = 0
+    for name, buffer in sections.items():
+        view = memoryview(buffer)
+        layout[name] = [view.format, offset, view.nbytes]
+        offset += -(-view.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header = json.dumps(
+        {"version": FORMAT_VERSION, "byteorder": sys.byteorder, "meta": meta, "sections": layout},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    prefix_length = len(MAGIC) + 4 + len(header)
+    padding = -prefix_length % _ALIGNMENT
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header) + padding))
+        f.write(header + b" " * padding)
+        for name, buffer in sections.items():
+            view = memoryview(buffer).cast("B")
+            f.write(view)
+            f.write(b"\x00" * (-len(view) % _ALIGNMENT))
+
+
+def open_sections(path: str) -> Tuple[dict, Dict[str, memoryview]]:
+    """Memory-map a file written by ``write_sections``.
+
+    Returns the ``meta`` header and zero-copy typed ``memoryview`` sections.
+    Pages are shared between every process that maps the same file.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise ResourceLoadError(f"Cannot map {path}: {e}") from e
+
+    if mapped[: len(MAGIC)] != MAGIC:
+        raise UnsupportedFormatError(f"{path} is not a qaznltk binary file")
+    (header_length,) = struct.unpack_from("<I", mapped, len(MAGIC))
+    body_start = len(MAGIC) + 4
+    header = json.loads(bytes(mapped[body_start : body_start + header_length]).decode("utf-8"))
+    if header.get("version") != FORMAT_VERSION:
+        raise UnsupportedFormatError(f"Unsupported qaznltk binary version: {header.get('version')}")
+    if header.get("byteorder") != sys.byteorder:
+        raise UnsupportedFormatError(f"{path} was written on a {header.get('byteorder')}-endian machine")
+
+    data_start = body_start + header_length
+    view = memoryview(mapped)
+    sections = {}
+    for name, (typecode, offset, nbytes) in header["sections"].items():
+        start = data_start + offset
+        sections[name] = view[start : start + nbytes].cast(typecode)
+    return header["meta"], sections
+
+
+def pack_terms(terms: Sequence[str]) -> Tuple[array, bytes]:
+    """Pack terms into an offsets array and a single UTF-8 blob."""
+    offsets = array("q", [0])
+    chunks = []
+    position = 0
+    for term in terms:
+        encoded = term.encode("utf-8")
+        chunks.append(encoded)
+        position += len(encoded)
+        offsets.append(position)
+    return offsets, b"".join(chunks)
+
+
+class TermTable(Mapping):
+    """Read-only ``term -> index`` mapping over a packed, sorted term table.
+
+    Lookups binary-search the UTF-8 blob (byte order equals code point
+    order), so nothing is decoded or hashed up front when a model is loaded.
+    """
+
+    def __init__(self, offsets: Sequence[int], blob: Buffer):
+        self.offsets = offsets
+        self.blob = memoryview(blob).cast("B") if not isinstance(blob, bytes) else blob
+
+    def _term_bytes(self, index: int) -> bytes:
+        return bytes(self.blob[self.offsets[index] : self.offsets[index + 1]])
+
+    def term(self, index: int) -> str:
+        """Return the term stored at ``index``."""
+        return self._term_bytes(index).decode("utf-8")
+
+    def __getitem__(self, term: str) -> int:
+        if not isinstance(term, str):
+            raise KeyError(term)
+        target = term.encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self._term_bytes(lo) == target:
+            return lo
+        raise KeyError(term)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.term(index)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class TermValues(Mapping):
+    """Read-only ``term -> value`` mapping backed by a ``TermTable`` and an array."""
+
+    def __init__(self, terms: TermTable, values: Sequence[float]):
+        self.terms = terms
+        self.values = values
+
+    def __getitem__(self, term: str) -> float:
+        return self.values[self.terms[term]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.terms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
@@ -1,82 +1,699 @@
+import heapq
 import math
+from array import array
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Dict, NamedTuple, Optional, Sequence, Tuple, Union
 import re
+import zlib
+
+from .exceptions import InvalidInputError, UnsupportedFormatError
+from .instrumentation import instrumented
+from .lexicons import get_lexicon
+from .storage import TermTable, TermValues, open_sections, pack_terms, write_sections
+from .utils import process_pool, resolve_n_jobs, split_evenly
+
+class CSRMatrix:
+    """Compressed sparse row matrix backed by compact ``array`` buffers.
+
+    ``data``, ``indices`` and ``indptr`` follow the usual CSR layout, so they
+    can be handed to ``scipy.sparse.csr_matrix((data, indices, indptr), shape)``
+    without copying. Indexing or iterating yields dense rows for backwards
+    compatibility with code written against the list-of-lists output.
+    """
+
+    __slots__ = ("data", "indices", "indptr", "shape")
+
+    def __init__(self, data: array, indices: array, indptr: array, shape: Tuple[int, int]):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+
+    @classmethod
+    def from_dense(cls, rows: Sequence[Sequence[float]]) -> "CSRMatrix":
+        """Build a CSR matrix from dense rows, dropping zero cells."""
+        data = array("d")
+        indices = array("i")
+        indptr = array("q", [0])
+        num_cols = 0
+        for row in rows:
+            num_cols = len(row)
+            for col, value in enumerate(row):
+                if value:
+                    indices.append(col)
+                    data.append(value)
+            indptr.append(len(data))
+        return cls(data, indices, indptr, (len(indptr) - 1, num_cols))
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, row: int) -> List[float]:
+        if row < 0:
+            row += self.shape[0]
+        if not 0 <= row < self.shape[0]:
+            raise IndexError("row index out of range")
+        dense = [0.0] * self.shape[1]
+        for col, value in self.row_items(row):
+            dense[col] = value
+        return dense
+
+    def __iter__(self) -> Iterator[List[float]]:
+        for row in range(self.shape[0]):
+            yield self[row]
+
+    def row_items(self, row: int) -> Iterator[Tuple[int, float]]:
+        """Yield ``(column, value)`` pairs of the non-zero entries of a row."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+
+    def toarray(self) -> List[List[float]]:
+        """Return the matrix as a dense list of lists."""
+        return list(self)
+
 
 class QazNLTKVectorizer:
-    def __init__(self):
-        self.vocabulary = set()
+    """TF-IDF vectorizer with a fitted vocabulary and optional KNN-ready sparse output.
+
+    Documents are texts, or pre-tokenized sequences used as they are: lists
+    of tokens or ``Vocabulary.encode`` ID arrays, which skip tokenization and
+    stop-word filtering. With ID arrays, ``vocabulary`` and ``idf_values``
+    are keyed by token ID.
+    """
+
+    DTYPES = {"float64": "d", "float32": "f"}
+
+    def __init__(
+        self,
+        sparse: bool = False,
+        n_jobs: int = 1,
+        min_df: Union[int, float] = 1,
+        max_df: Union[int, float] = 1.0,
+        max_features: Optional[int] = None,
+        stop_words: Union[str, Iterable[str], None] = None,
+        dtype: str = "float64",
+    ):
+        # ~ sparse=True returns CSRMatrix instances instead of dense lists
+        self.sparse = sparse
+        # ~ n_jobs > 1 (or -1 for all cores) shards fit_transform/transform over processes
+        self.n_jobs = n_jobs
+        # ~ int thresholds are document counts, floats are fractions of the corpus
+        for name, value in (("min_df", min_df), ("max_df", max_df)):
+            if isinstance(value, float) and not 0.0 <= value <= 1.0 or value < 0:
+                raise InvalidInputError(f"{name} must be a non-negative int or a float in [0, 1]")
+        if max_features is not None and max_features < 0:
+            raise InvalidInputError("max_features must be non-negative")
+        if dtype not in self.DTYPES:
+            raise InvalidInputError(f"dtype must be one of {tuple(self.DTYPES)}")
+        self.min_df = min_df
+        self.max_df = max_df
+        self.max_features = max_features
+        # ~ stop_words="kazakh" uses the bundled special_words/stop_words.txt
+        self.stop_words = _resolve_stop_words(stop_words)
+        self.dtype = dtype
+        self.vocabulary: Dict[str, int] = {}
         self.idf_values = {}
         self.tf_idf_matrix = []
+        # ~ running DF (and, for max_features, corpus TF) statistics, kept between partial_fit calls
+        self.doc_freq: Counter = Counter()
+        self.term_freq: Counter = Counter()
+        self.num_documents = 0
     
-    def fit_transform(self, documents: List[str]) -> List[List[float]]:
-        # ~ build the vocabulary
+    @instrumented("QazNLTKVectorizer.fit_transform", size=lambda self, documents: len(documents))
+    def fit_transform(self, documents: List[str]) -> Union[CSRMatrix, List[List[float]]]:
+        self.__reset()
+        n_jobs = resolve_n_jobs(self.n_jobs)
+        if n_jobs > 1 and len(documents) > 1:
+            return self.__parallel_fit_transform(documents, n_jobs)
+
         tokenized_documents = [self.__tokenize(doc) for doc in documents]
-        self.vocabulary = set(token for doc in tokenized_documents for token in doc)
+        self.__count(tokenized_documents)
+        self.finalize()
         
-        # ~ compute document frequencies (DF)
-        doc_freq = defaultdict(int)
-        for doc in tokenized_documents:
-            for token in set(doc): 
-                doc_freq[token] += 1
+        # ~ compute TF-IDF for each document
+        self.tf_idf_matrix = self.__rows(tokenized_documents)
+        return self.tf_idf_matrix
+
+    def __parallel_fit_transform(self, documents: List[str], n_jobs: int) -> Union[CSRMatrix, List[List[float]]]:
+        # ~ map: every worker tokenizes its shard and counts DF; reduce: sum the counters
+        # ~ every shard is tokenized once; rows are then built from its counts on shard-local term IDs,
+        # ~ so workers only receive the columns and IDF values of the terms their shard contains
+        shards = split_evenly(documents, n_jobs)
+        with process_pool(len(shards)) as pool:
+            counted = list(pool.map(_count_shard, shards, [self.stop_words] * len(shards)))
+            for shard in counted:
+                self.doc_freq.update(dict(zip(shard.terms, shard.doc_freq)))
+                if self.max_features is not None:
+                    self.term_freq.update(dict(zip(shard.terms, shard.term_freq)))
+                self.num_documents += len(shard.lengths)
+            self.finalize()
+            vocabulary, idf_values = self.vocabulary, self.idf_values
+            columns = [array("i", (vocabulary.get(term, -1) for term in shard.terms)) for shard in counted]
+            weights = [array("d", (idf_values.get(term, 0.0) for term in shard.terms)) for shard in counted]
+            parts = list(
+                pool.map(
+                    _rows_from_counts,
+                    counted,
+                    columns,
+                    weights,
+                    [len(vocabulary)] * len(shards),
+                    [self.DTYPES[self.dtype]] * len(shards),
+                )
+            )
+        self.tf_idf_matrix = self.__finish(_concat_csr(parts, len(self.vocabulary)))
+        return self.tf_idf_matrix
+
+    def fit(self, documents: Iterable[str]) -> "QazNLTKVectorizer":
+        """Fit vocabulary and IDF from any iterable without keeping the documents."""
+        self.__reset()
+        return self.partial_fit(documents).finalize()
+
+    def partial_fit(self, documents: Iterable[str]) -> "QazNLTKVectorizer":
+        """Accumulate document frequencies from a batch; call ``finalize`` afterwards."""
+        self.__count(self.__tokenize(doc) for doc in documents)
+        return self
+
+    def finalize(self) -> "QazNLTKVectorizer":
+        """Build the vocabulary and IDF values from the accumulated statistics."""
+        num_documents = self.num_documents
+        min_count = self.min_df if isinstance(self.min_df, int) else math.ceil(self.min_df * num_documents)
+        max_count = self.max_df if isinstance(self.max_df, int) else math.floor(self.max_df * num_documents)
+        terms = [token for token, df in self.doc_freq.items() if min_count <= df <= max_count]
+        if self.max_features is not None and len(terms) > self.max_features:
+            # ~ keep the most frequent terms in the corpus, ties broken alphabetically
+            term_freq = self.term_freq
+            terms = sorted(terms, key=lambda token: (-term_freq[token], token))[: self.max_features]
+
+        # ~ build the vocabulary with a stable term -> column index
+        self.vocabulary = {token: idx for idx, token in enumerate(sorted(terms))}
         
         # ~ compute inverse document frequency (IDF)
-        num_documents = len(documents)
+        doc_freq = self.doc_freq
         self.idf_values = {
-            token: math.log(num_documents / (df + 1))
-            for token, df in doc_freq.items()
+            token: math.log(num_documents / (doc_freq[token] + 1))
+            for token in self.vocabulary
         }
-        
-        # ~ compute TF-IDF for each document
-        self.tf_idf_matrix = []
+        return self
+
+    def __reset(self) -> None:
+        self.doc_freq = Counter()
+        self.term_freq = Counter()
+        self.num_documents = 0
+
+    def __count(self, tokenized_documents: Iterable[List[str]]) -> None:
+        # ~ compute document frequencies (DF)
+        doc_freq = self.doc_freq
+        term_freq = self.term_freq if self.max_features is not None else None
         for doc in tokenized_documents:
-            tf = Counter(doc)
-            doc_length = len(doc)
-            tf_idf_vector = [
-                (tf[token] / doc_length) * self.idf_values.get(token, 0) for token in self.vocabulary
-            ]
-            self.tf_idf_matrix.append(tf_idf_vector)
-        
-        return self.tf_idf_matrix
-    
+            doc_freq.update(set(doc))
+            if term_freq is not None:
+                term_freq.update(doc)
+            self.num_documents += 1
+
     def __tokenize(self, text: str) -> List[str]:
-        # ~ tokenization function
-        tokens = re.findall(r'\w+', text.lower())
-        return [token for token in tokens]
+        return _tokenize(text, self.stop_words)
+
+    def __rows(self, tokenized_documents: List[List[str]]) -> Union[CSRMatrix, List[List[float]]]:
+        return self.__finish(
+            _build_csr(tokenized_documents, self.vocabulary, self.idf_values, self.DTYPES[self.dtype])
+        )
     
-    def transform(self, new_documents: List[str]) -> List[List[float]]:
+    def transform(self, new_documents: List[str]) -> Union[CSRMatrix, List[List[float]]]:
         # ~ transform new documents into vectors using the existing vocabulary and IDF values
-        tokenized_documents = [self.__tokenize(doc) for doc in new_documents]
-        transformed_vectors = []
-        
+        n_jobs = resolve_n_jobs(self.n_jobs)
+        if n_jobs > 1 and len(new_documents) > 1:
+            shards = split_evenly(new_documents, n_jobs)
+            with process_pool(len(shards)) as pool:
+                parts = list(pool.map(_transform_shard, shards, *self.__shard_args(len(shards))))
+            return self.__finish(_concat_csr(parts, len(self.vocabulary)))
+        return self.__rows([self.__tokenize(doc) for doc in new_documents])
+
+    def __shard_args(self, num_shards: int) -> Tuple[list, ...]:
+        # ~ memory-mapped tables from load() cannot be pickled, so ship plain dicts
+        vocabulary = self.vocabulary if isinstance(self.vocabulary, dict) else dict(self.vocabulary)
+        idf_values = self.idf_values if isinstance(self.idf_values, dict) else dict(self.idf_values)
+        return (
+            [vocabulary] * num_shards,
+            [idf_values] * num_shards,
+            [self.stop_words] * num_shards,
+            [self.DTYPES[self.dtype]] * num_shards,
+        )
+
+    def iter_transform(
+        self, documents: Iterable[str], chunk_size: int = 1000
+    ) -> Iterator[Union[CSRMatrix, List[List[float]]]]:
+        """Lazily transform an iterable, yielding one matrix per ``chunk_size`` documents."""
+        if chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be positive")
+        chunk = []
+        for doc in documents:
+            chunk.append(self.__tokenize(doc))
+            if len(chunk) == chunk_size:
+                yield self.__rows(chunk)
+                chunk = []
+        if chunk:
+            yield self.__rows(chunk)
+
+    def __finish(self, matrix: CSRMatrix) -> Union[CSRMatrix, List[List[float]]]:
+        return matrix if self.sparse else matrix.toarray()
+
+    def save(self, path: str) -> None:
+        """Write the fitted vocabulary, float32 IDF and CSR TF-IDF matrix to ``path``."""
+        # ~ columns are assigned in sorted term order, which TermTable lookups rely on
+        terms = sorted(self.vocabulary, key=self.vocabulary.__getitem__)
+        if not all(isinstance(term, str) for term in terms):
+            raise InvalidInputError("only vectorizers fitted on text or string tokens can be saved")
+        term_offsets, term_blob = pack_terms(terms)
+        matrix = _as_csr(self.tf_idf_matrix)
+        write_sections(
+            path,
+            {
+                "kind": "QazNLTKVectorizer",
+                "sparse": self.sparse,
+                "dtype": self.dtype,
+                "stop_words": sorted(self.stop_words),
+                "shape": list(matrix.shape),
+            },
+            {
+                "term_offsets": term_offsets,
+                "term_blob": term_blob,
+                "idf": array("f", (self.idf_values[term] for term in terms)),
+                "data": array("f", matrix.data),
+                "indices": array("i", matrix.indices),
+                "indptr": array("q", matrix.indptr),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "QazNLTKVectorizer":
+        """Memory-map a vectorizer written by ``save``; no arrays are copied."""
+        meta, sections = open_sections(path)
+        if meta.get("kind") != "QazNLTKVectorizer":
+            raise UnsupportedFormatError(f"{path} does not contain a QazNLTKVectorizer")
+        vectorizer = cls(sparse=meta["sparse"], stop_words=meta["stop_words"], dtype=meta["dtype"])
+        vectorizer.vocabulary = TermTable(sections["term_offsets"], sections["term_blob"])
+        vectorizer.idf_values = TermValues(vectorizer.vocabulary, sections["idf"])
+        vectorizer.tf_idf_matrix = CSRMatrix(
+            sections["data"], sections["indices"], sections["indptr"], tuple(meta["shape"])
+        )
+        return vectorizer
+
+
+
+class QazNLTKHashingVectorizer:
+    """Stateless TF(-IDF) vectorizer that hashes tokens into ``n_features`` buckets.
+
+    Buckets come from CRC32 of the UTF-8 token, so every process maps a token
+    to the same column without sharing a vocabulary and memory stays constant.
+    Pure TF features need no fitting; with ``use_idf=True`` bucket document
+    frequencies are learned through ``partial_fit`` and applied after ``finalize``.
+    Rows are a ``CSRMatrix`` by default; ``sparse=False`` returns dense lists of
+    ``n_features`` columns each and is only practical for a small ``n_features``.
+    """
+
+    def __init__(self, n_features: int = 2 ** 20, use_idf: bool = False, sparse: bool = True):
+        if n_features <= 0:
+            raise InvalidInputError("n_features must be positive")
+        self.n_features = n_features
+        self.use_idf = use_idf
+        self.sparse = sparse
+        self.doc_freq = array("q", [0]) * n_features if use_idf else None
+        self.num_documents = 0
+        self.idf = None
+
+    def bucket(self, token: str) -> int:
+        """Return the column index of a token."""
+        return zlib.crc32(token.encode("utf-8")) % self.n_features
+
+    def partial_fit(self, documents: Iterable[str]) -> "QazNLTKHashingVectorizer":
+        """Accumulate bucket document frequencies; only meaningful with ``use_idf``."""
+        if self.use_idf:
+            doc_freq = self.doc_freq
+            for doc in documents:
+                for col in {self.bucket(token) for token in _tokenize(doc)}:
+                    doc_freq[col] += 1
+                self.num_documents += 1
+        return self
+
+    def finalize(self) -> "QazNLTKHashingVectorizer":
+        """Compute bucket IDF values from the accumulated document frequencies."""
+        if self.use_idf:
+            num_documents = self.num_documents
+            if not num_documents:
+                # ~ nothing was fitted: every bucket gets a zero weight
+                self.idf = array("d", [0.0]) * self.n_features
+            else:
+                self.idf = array("d", (math.log(num_documents / (df + 1)) for df in self.doc_freq))
+        return self
+
+    @instrumented("QazNLTKHashingVectorizer.fit_transform", size=lambda self, documents: len(documents))
+    def fit_transform(self, documents: List[str]) -> Union[CSRMatrix, List[List[float]]]:
+        if self.use_idf:
+            self.doc_freq = array("q", [0]) * self.n_features
+            self.num_documents = 0
+            self.partial_fit(documents).finalize()
+        return self.transform(documents)
+
+    def transform(self, documents: Iterable[str]) -> Union[CSRMatrix, List[List[float]]]:
+        if self.use_idf and self.idf is None:
+            raise InvalidInputError("call partial_fit and finalize before transform when use_idf=True")
+        matrix = self.__build_csr([_tokenize(doc) for doc in documents])
+        return matrix if self.sparse else matrix.toarray()
+
+    def iter_transform(
+        self, documents: Iterable[str], chunk_size: int = 1000
+    ) -> Iterator[Union[CSRMatrix, List[List[float]]]]:
+        """Lazily transform an iterable, yielding one matrix per ``chunk_size`` documents."""
+        if chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be positive")
+        chunk = []
+        for doc in documents:
+            chunk.append(doc)
+            if len(chunk) == chunk_size:
+                yield self.transform(chunk)
+                chunk = []
+        if chunk:
+            yield self.transform(chunk)
+
+    def __build_csr(self, tokenized_documents: List[List[str]]) -> CSRMatrix:
+        idf = self.idf if self.use_idf else None
+        data = array("d")
+        indices = array("i")
+        indptr = array("q", [0])
         for doc in tokenized_documents:
-            tf = Counter(doc)
             doc_length = len(doc)
-            tf_idf_vector = [
-                (tf[token] / doc_length) * self.idf_values.get(token, 0) for token in self.vocabulary
-            ]
-            transformed_vectors.append(tf_idf_vector)
-        
-        return transformed_vectors
+            counts = Counter(self.bucket(token) for token in doc)
+            for col in sorted(counts):
+                value = counts[col] / doc_length
+                if idf is not None:
+                    value *= idf[col]
+                if value:
+                    indices.append(col)
+                    data.append(value)
+            indptr.append(len(data))
+        return CSRMatrix(data, indices, indptr, (len(tokenized_documents), self.n_features))
+
+
+def _as_csr(matrix: Union[CSRMatrix, Sequence[Sequence[float]]]) -> CSRMatrix:
+    return matrix if isinstance(matrix, CSRMatrix) else CSRMatrix.from_dense(matrix)
+
+def _resolve_stop_words(stop_words: Union[str, Iterable[str], None]) -> frozenset:
+    if stop_words is None:
+        return frozenset()
+    if isinstance(stop_words, str):
+        if stop_words != "kazakh":
+            raise InvalidInputError('stop_words must be "kazakh", an iterable of words or None')
+        return get_lexicon("stop_words")
+    return frozenset(stop_words)
+
+
+def _tokenize(text: Union[str, Sequence], stop_words: frozenset = frozenset()) -> Sequence:
+    # ~ pre-tokenized documents (token lists, Vocabulary ID arrays) are used as they are
+    if not isinstance(text, str):
+        return text
+    # ~ tokenization function
+    tokens = re.findall(r'\w+', text.lower())
+    if stop_words:
+        return [token for token in tokens if token not in stop_words]
+    return tokens
+
+
+def _build_csr(
+    tokenized_documents: List[List[str]],
+    vocabulary: Dict[str, int],
+    idf_values: Dict[str, float],
+    typecode: str = "d",
+) -> CSRMatrix:
+    # ~ only the non-zero cells are visited, so the cost scales with nnz
+    data = array(typecode)
+    indices = array("i")
+    indptr = array("q", [0])
+
+    for doc in tokenized_documents:
+        doc_length = len(doc)
+        row = sorted(
+            (vocabulary[token], token, count)
+            for token, count in Counter(doc).items()
+            if token in vocabulary
+        )
+        for col, token, count in row:
+            value = (count / doc_length) * idf_values[token]
+            if value:
+                indices.append(col)
+                data.append(value)
+        indptr.append(len(data))
+
+    return CSRMatrix(data, indices, indptr, (len(tokenized_documents), len(vocabulary)))
+
+
+def _concat_csr(parts: List[CSRMatrix], num_cols: int) -> CSRMatrix:
+    data = array(parts[0].data.typecode if parts else "d")
+    indices = array("i")
+    indptr = array("q", [0])
+    for part in parts:
+        offset = indptr[-1]
+        data.extend(part.data)
+        indices.extend(part.indices)
+        indptr.extend(ptr + offset for ptr in part.indptr[1:])
+    return CSRMatrix(data, indices, indptr, (len(indptr) - 1, num_cols))
+
+
+class _ShardCounts(NamedTuple):
+    # ~ per-document term counts of one shard, CSR-like on shard-local term IDs (index into terms)
+    terms: list
+    doc_freq: array
+    term_freq: array
+    indptr: array
+    ids: array
+    counts: array
+    lengths: array
+
+
+def _count_shard(documents: List[str], stop_words: frozenset) -> _ShardCounts:
+    # ~ process-pool worker: tokenize one shard once, counting DF, corpus TF and per-document TF
+    local_ids: Dict[str, int] = {}
+    doc_freq = array("q")
+    term_freq = array("q")
+    indptr = array("q", [0])
+    ids = array("i")
+    counts = array("i")
+    lengths = array("q")
+    for doc in documents:
+        tokens = _tokenize(doc, stop_words)
+        lengths.append(len(tokens))
+        for token, count in Counter(tokens).items():
+            local_id = local_ids.get(token)
+            if local_id is None:
+                local_id = local_ids[token] = len(local_ids)
+                doc_freq.append(0)
+                term_freq.append(0)
+            doc_freq[local_id] += 1
+            term_freq[local_id] += count
+            ids.append(local_id)
+            counts.append(count)
+        indptr.append(len(ids))
+    return _ShardCounts(list(local_ids), doc_freq, term_freq, indptr, ids, counts, lengths)
+
+
+def _rows_from_counts(shard: _ShardCounts, columns: array, idf: array, num_cols: int, typecode: str) -> CSRMatrix:
+    # ~ process-pool worker: TF-IDF rows of a counted shard; columns[id] is -1 for pruned terms
+    data = array(typecode)
+    indices = array("i")
+    indptr = array("q", [0])
+    ids, counts = shard.ids, shard.counts
+    for doc, doc_length in enumerate(shard.lengths):
+        start, end = shard.indptr[doc], shard.indptr[doc + 1]
+        row = sorted(
+            (columns[local_id], local_id, count)
+            for local_id, count in zip(ids[start:end], counts[start:end])
+            if columns[local_id] >= 0
+        )
+        for col, local_id, count in row:
+            value = (count / doc_length) * idf[local_id]
+            if value:
+                indices.append(col)
+                data.append(value)
+        indptr.append(len(data))
+    return CSRMatrix(data, indices, indptr, (len(shard.lengths), num_cols))
+
+
+def _transform_shard(
+    documents: List[str],
+    vocabulary: Dict[str, int],
+    idf_values: Dict[str, float],
+    stop_words: frozenset,
+    typecode: str,
+) -> CSRMatrix:
+    # ~ process-pool worker: TF-IDF rows for one shard
+    return _build_csr([_tokenize(doc, stop_words) for doc in documents], vocabulary, idf_values, typecode)
+
 
 class KNN:
-    def __init__(self, vectors: List[List[float]]):
+    METRICS = ("cosine", "dot")
+
+    def __init__(self, vectors: Union[CSRMatrix, List[List[float]]]):
+        # ~ vectors are referenced, not copied; search indexes are built lazily
         self.vectors = vectors
+        self._postings = None
+        self._norms = None
     
     def __euclidean_distance(self, vec1: List[float], vec2: List[float]) -> float:
         return math.sqrt(sum((a - b) ** 2 for a, b in zip(vec1, vec2)))
     
+    @instrumented("KNN.search", size=lambda self, *args, **kwargs: len(self.vectors))
     def search(self, query_vector: List[float], k: int = 5) -> List[Tuple[int, float]]:
-        distances = []
-        
-        for idx, vector in enumerate(self.vectors):
-            distance = self.__euclidean_distance(query_vector, vector)
-            distances.append((idx, distance))
-        
-        # ~ sort by distance and return top k
-        distances.sort(key=lambda x: x[1])
-        return distances[:k]
-    
+        distances = (
+            (idx, self.__euclidean_distance(query_vector, vector))
+            for idx, vector in enumerate(self.vectors)
+        )
+        # ~ select the k nearest without sorting every distance
+        return heapq.nsmallest(k, distances, key=itemgetter(1))
+
+    @instrumented("KNN.search_batch", size=lambda self, queries, *args, **kwargs: len(queries))
+    def search_batch(
+        self,
+        query_vectors: Union[CSRMatrix, Sequence[Sequence[float]]],
+        k: int = 5,
+        metric: str = "cosine",
+    ) -> List[List[Tuple[int, float]]]:
+        """Return the top-k ``(index, score)`` pairs for every query, best first.
+
+        ``metric`` is ``"cosine"`` or ``"dot"`` (inner product). Sparse indexes
+        are scored through column posting lists, so each query only touches
+        the stored rows that share a non-zero column with it.
+        """
+        if metric not in self.METRICS:
+            raise InvalidInputError(f"metric must be one of {self.METRICS}")
+        if k <= 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        if isinstance(query_vectors, CSRMatrix):
+            queries = (list(query_vectors.row_items(row)) for row in range(len(query_vectors)))
+        else:
+            queries = ([(col, value) for col, value in enumerate(vector) if value] for vector in query_vectors)
+
+        score_fn = self.__sparse_scores if isinstance(self.vectors, CSRMatrix) else self.__dense_scores
+        norms = self.__get_norms() if metric == "cosine" else None
+        results = []
+        for query in queries:
+            scores = score_fn(query)
+            if norms is not None:
+                query_norm = math.sqrt(sum(value * value for _, value in query))
+                for idx, score in scores.items():
+                    denom = norms[idx] * query_norm
+                    scores[idx] = score / denom if denom else 0.0
+            results.append(self.__top_k(scores, k))
+        return results
+
+    def __top_k(self, scores: Dict[int, float], k: int) -> List[Tuple[int, float]]:
+        top = heapq.nlargest(k, scores.items(), key=itemgetter(1))
+        num_vectors = len(self.vectors)
+        # ~ rows without any shared column score exactly zero
+        if len(scores) < num_vectors and (len(top) < k or top[-1][1] < 0):
+            zeros = []
+            for idx in range(num_vectors):
+                if idx not in scores:
+                    zeros.append((idx, 0.0))
+                    if len(zeros) == k:
+                        break
+            top = heapq.nlargest(k, top + zeros, key=itemgetter(1))
+        return top
+
+    def __sparse_scores(self, query: List[Tuple[int, float]]) -> Dict[int, float]:
+        col_indptr, row_ids, values = self.__get_postings()
+        scores = defaultdict(float)
+        num_cols = len(col_indptr) - 1
+        for col, q_value in query:
+            if col >= num_cols:
+                continue
+            for pos in range(col_indptr[col], col_indptr[col + 1]):
+                scores[row_ids[pos]] += q_value * values[pos]
+        return scores
+
+    def __dense_scores(self, query: List[Tuple[int, float]]) -> Dict[int, float]:
+        return {
+            idx: sum(q_value * vector[col] for col, q_value in query)
+            for idx, vector in enumerate(self.vectors)
+        }
+
+    def __get_postings(self) -> Tuple[array, array, array]:
+        if self._postings is None:
+            self._postings = _column_postings(self.vectors)
+        return self._postings
+
+    def save(self, path: str) -> None:
+        """Write the indexed vectors together with their column postings and norms."""
+        # ~ dense indexes are converted for writing only; the instance is left as it is
+        matrix = _as_csr(self.vectors)
+        if matrix is self.vectors:
+            col_indptr, row_ids, values = self.__get_postings()
+        else:
+            col_indptr, row_ids, values = _column_postings(matrix)
+        write_sections(
+            path,
+            {"kind": "KNN", "shape": list(matrix.shape)},
+            {
+                "data": array("f", matrix.data),
+                "indices": array("i", matrix.indices),
+                "indptr": array("q", matrix.indptr),
+                "col_indptr": array("q", col_indptr),
+                "row_ids": array("i", row_ids),
+                "values": array("f", values),
+                "norms": array("f", self.__get_norms()),
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "KNN":
+        """Memory-map an index written by ``save``, ready to search immediately."""
+        meta, sections = open_sections(path)
+        if meta.get("kind") != "KNN":
+            raise UnsupportedFormatError(f"{path} does not contain a KNN index")
+        knn = cls(CSRMatrix(sections["data"], sections["indices"], sections["indptr"], tuple(meta["shape"])))
+        knn._postings = (sections["col_indptr"], sections["row_ids"], sections["values"])
+        knn._norms = sections["norms"]
+        return knn
+
+    def __get_norms(self) -> array:
+        if self._norms is None:
+            vectors = self.vectors
+            if isinstance(vectors, CSRMatrix):
+                norms = array("d", [0.0]) * len(vectors)
+                for row in range(len(vectors)):
+                    start, end = vectors.indptr[row], vectors.indptr[row + 1]
+                    norms[row] = math.sqrt(sum(value * value for value in vectors.data[start:end]))
+            else:
+                norms = array("d", (math.sqrt(sum(value * value for value in vector)) for vector in vectors))
+            self._norms = norms
+        return self._norms
+
+
+def _column_postings(matrix: CSRMatrix) -> Tuple[array, array, array]:
+    # ~ transpose CSR into column posting lists (CSC) once, in O(nnz)
+    num_cols = matrix.shape[1]
+    col_indptr = array("q", [0]) * (num_cols + 1)
+    for col in matrix.indices:
+        col_indptr[col + 1] += 1
+    for col in range(num_cols):
+        col_indptr[col + 1] += col_indptr[col]
+    row_ids = array("i", [0]) * matrix.nnz
+    typecode = getattr(matrix.data, "typecode", None) or matrix.data.format
+    values = array(typecode, [0.0]) * matrix.nnz
+    cursor = array("q", col_indptr)
+    for row in range(matrix.shape[0]):
+        for col, value in matrix.row_items(row):
+            pos = cursor[col]
+            row_ids[pos] = row
+            values[pos] = value
+            cursor[col] = pos + 1
+    return col_indptr, row_ids, values
+
+
 if __name__ == '__main__':
     documents = [
         "Әйелі жоқ үй – жетім.",
@@ -0,0 +1,96 @@
+"""Single-pass word tokenizer with streaming input and heap-based top-k."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from itertools import filterfalse
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .exceptions import InvalidInputError
+
+WORD_PATTERN = re.compile(r"\w+(?:-\w+)*")
+
+Source = Union[str, TextIO, Iterable[str]]
+
+
+class Tokenizer:
+    """Lower-casing word tokenizer with fused stop-word filtering and counting.
+
+    ``stop_words`` is kept by reference when it is a set, so later changes to
+    e.g. ``QazNLTK.stop_words`` are honoured.
+    """
+
+    def __init__(self, stop_words: Optional[Iterable[str]] = None, chunk_size: int = 1 << 16):
+        if chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be positive")
+        if stop_words is None:
+            stop_words = frozenset()
+        elif not isinstance(stop_words, (set, frozenset)):
+            stop_words = frozenset(stop_words)
+        self.stop_words = stop_words
+        self.chunk_size = chunk_size
+
+    def iter_tokens(self, source: Source) -> Iterator[str]:
+        """Lazily yield tokens from a string, a file-like object or an iterable of text chunks.
+
+        Input is processed in pieces cut at whitespace, so no token is split
+        and no full-text copy or token list is built.
+        """
+        is_stop_word = self.stop_words.__contains__
+        for piece in self.__pieces(source):
+            yield from filterfalse(is_stop_word, WORD_PATTERN.findall(piece.lower()))
+
+    def count(self, source: Source) -> Counter:
+        """Return token frequencies in first-occurrence order."""
+        # counting runs in C; stop words are removed once per distinct token afterwards
+        counts = Counter()
+        for piece in self.__pieces(source):
+            counts.update(WORD_PATTERN.findall(piece.lower()))
+        for token in self.stop_words & counts.keys():
+            del counts[token]
+        return counts
+
+    def most_common(self, source: Source, top_k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return ``(token, count)`` pairs by descending frequency.
+
+        With ``top_k`` only the k most frequent tokens are selected with a
+        heap; ties keep first-occurrence order either way.
+        """
+        return self.count(source).most_common(top_k)
+
+    def __pieces(self, source: Source) -> Iterator[str]:
+        chunk_size = self.chunk_size
+        if isinstance(source, str):
+            if len(source) <= chunk_size:
+                yield source
+                return
+            chunks = (source[i : i + chunk_size] for i in range(0, len(source), chunk_size))
+        elif hasattr(source, "read"):
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = iter(source)
+
+        carry = ""
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise InvalidInputError("text chunks must be strings")
+            buffer = carry + chunk
+            # cut after the last whitespace so tokens never straddle two pieces
+            cut = _after_last_space(buffer)
+            if not cut:
+                if len(buffer) < 4 * chunk_size:
+                    carry = buffer
+                    continue
+                cut = len(buffer)
+            yield buffer[:cut]
+            carry = buffer[cut:]
+        if carry:
+            yield carry
+
+
+def _after_last_space(text: str) -> int:
+    for i in range(len(text) - 1, -1, -1):
+        if text[i].isspace():
+            return i + 1
+    return 0
@@ -0,0 +1,110 @@
+"""Compiled, table-driven transliteration with streaming input."""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Iterator, TextIO, Union
+
+from .exceptions import InvalidInputError
+
+Source = Union[str, TextIO, Iterable[str]]
+
+
+class Transliterator:
+    """Character mapping compiled into a ``str.translate`` table plus a longest-match pattern.
+
+    Single-codepoint keys are handled by ``str.translate``; keys spanning
+    several codepoints (e.g. a letter followed by a combining mark) are
+    matched longest-first before the table is applied to the text between
+    them. Unmapped characters are kept as they are.
+    """
+
+    def __init__(self, mapping: Dict[str, str]):
+        if any(not key for key in mapping):
+            raise InvalidInputError("mapping keys must be non-empty strings")
+        self.mapping = dict(mapping)
+        self._table = str.maketrans({key: value for key, value in mapping.items() if len(key) == 1})
+        sequences = sorted((key for key in mapping if len(key) > 1), key=len, reverse=True)
+        self._sequences = {key: mapping[key] for key in sequences}
+        self._pattern = re.compile("(" + "|".join(map(re.escape, sequences)) + ")") if sequences else None
+        # ~ tails that may still grow into a sequence are held back between chunks
+        self._prefixes = frozenset(key[:size] for key in sequences for size in range(1, len(key)))
+        self._max_prefix = max(map(len, self._prefixes), default=0)
+        self._replace_only = _replace_is_exact(self._sequences, self._table)
+
+    def convert(self, text: str) -> str:
+        if not isinstance(text, str):
+            raise InvalidInputError("text must be a string")
+        if self._pattern is None:
+            return text.translate(self._table)
+        if self._replace_only:
+            for key, value in self._sequences.items():
+                text = text.replace(key, value)
+            return text.translate(self._table)
+        parts = self._pattern.split(text)
+        if len(parts) == 1:
+            return text.translate(self._table)
+        table, sequences = self._table, self._sequences
+        # ~ split() alternates plain text (even indices) and matched sequences (odd indices)
+        return "".join(sequences[part] if i & 1 else part.translate(table) for i, part in enumerate(parts))
+
+    __call__ = convert
+
+    def convert_batch(self, texts: Iterable[str]) -> Iterator[str]:
+        """Lazily convert every text of an iterable."""
+        return map(self.convert, texts)
+
+    def iter_convert(self, source: Source, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """Lazily convert a string, a file-like object or an iterable of text chunks.
+
+        Sequences split across chunk boundaries are still matched, so joining
+        the output equals ``convert`` of the joined input.
+        """
+        if chunk_size <= 0:
+            raise InvalidInputError("chunk_size must be positive")
+        if isinstance(source, str):
+            chunks = (source[i : i + chunk_size] for i in range(0, len(source), chunk_size))
+        elif hasattr(source, "read"):
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = iter(source)
+
+        carry = ""
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise InvalidInputError("text chunks must be strings")
+            buffer = carry + chunk
+            held = self.__pending(buffer)
+            carry = buffer[len(buffer) - held :] if held else ""
+            if len(buffer) > held:
+                yield self.convert(buffer[: len(buffer) - held])
+        if carry:
+            yield self.convert(carry)
+
+    def convert_file(self, src_path: str, dst_path: str, encoding: str = "utf-8", chunk_size: int = 1 << 20) -> None:
+        """Convert a text file chunk by chunk in constant memory; line endings are kept."""
+        with open(src_path, encoding=encoding, newline="") as src, open(
+            dst_path, "w", encoding=encoding, newline=""
+        ) as dst:
+            for piece in self.iter_convert(src, chunk_size):
+                dst.write(piece)
+
+    def __pending(self, buffer: str) -> int:
+        for size in range(min(self._max_prefix, len(buffer)), 0, -1):
+            if buffer[-size:] in self._prefixes:
+                return size
+        return 0
+
+
+def _replace_is_exact(sequences: Dict[str, str], table: dict) -> bool:
+    # ~ chained str.replace equals the longest-match pass when sequences can
+    # ~ neither overlap nor nest and no replacement can be matched again
+    keys = list(sequences)
+    for key in keys:
+        for other in keys:
+            if key != other and other in key:
+                return False
+            if any(key.endswith(other[:size]) for size in range(1, len(other))):
+                return False
+    key_chars = {char for key in keys for char in key}
+    return not any(ord(char) in table or char in key_chars for value in sequences.values() for char in value)
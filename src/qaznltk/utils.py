@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import os
 import re
-from collections import Counter
-from functools import lru_cache
-from typing import Iterable, List, Sequence, Union
+from array import array
+from collections import Counter, deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
 
+from .cache import cached
 from .exceptions import InvalidInputError, ResourceLoadError
+from .instrumentation import instrumented
+from .tokenizer import WORD_PATTERN
+
+T = TypeVar("T")
 
 
 def normalize_text(text: str) -> str:
@@ -21,7 +28,7 @@ def tokenize_words(text: str) -> List[str]:
     """Split text into word tokens using a regex-based approach."""
     if not isinstance(text, str):
         raise InvalidInputError("text must be a string")
-    return re.findall(r"\w+(?:-\w+)*", text.lower())
+    return WORD_PATTERN.findall(text.lower())
 
 
 def compute_jaccard_similarity(str1: str, str2: str) -> float:
@@ -33,31 +40,173 @@ def compute_jaccard_similarity(str1: str, str2: str) -> float:
     return intersection / union if union else 0.0
 
 
-@lru_cache(maxsize=None)
-def levenshtein_distance(s1: Union[str, Sequence[str]], s2: Union[str, Sequence[str]]) -> int:
-    """Calculate the Levenshtein distance between two strings or sequences."""
-    if not isinstance(s1, (str, list, tuple)) or not isinstance(s2, (str, list, tuple)):
-        raise InvalidInputError("Inputs must be strings or sequences of strings")
+# ~ bounded so long-running services do not keep every compared pair forever
+@instrumented("levenshtein_distance", size=lambda s1, s2, *args, **kwargs: len(s1) + len(s2))
+@cached("levenshtein_distance", maxsize=4096, maxbytes=64 * 1024 * 1024)
+def levenshtein_distance(
+    s1: Union[str, Sequence[str]],
+    s2: Union[str, Sequence[str]],
+    max_distance: Optional[int] = None,
+) -> int:
+    """Calculate the Levenshtein distance between two strings or sequences (e.g. token ID arrays).
+
+    Uses the Myers/Hyyrö bit-parallel algorithm, so each element of the longer
+    input costs a handful of big-integer operations instead of a full DP row.
+    With ``max_distance`` the computation stops as soon as the distance is
+    known to exceed it and ``max_distance + 1`` is returned. Pass
+    ``use_cache=False`` to skip the result cache for one call.
+    """
+    if not _is_sequence(s1) or not _is_sequence(s2):
+        raise InvalidInputError("Inputs must be strings, sequences of strings or token ID arrays")
 
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
-
-
-def frequency_tokens(tokens: Iterable[str]) -> List[tuple]:
-    """Return tokens sorted by frequency descending."""
-    freqs = Counter(tokens)
-    return sorted(freqs.items(), key=lambda item: item[1], reverse=True)
\ No newline at end of file
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+
+    # ~ common prefix and suffix never change the distance
+    start = 0
+    limit = len(s2)
+    while start < limit and s1[start] == s2[start]:
+        start += 1
+    end1, end2 = len(s1), len(s2)
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    text, pattern = s1[start:end1], s2[start:end2]
+
+    if len(pattern) == 0:
+        distance = len(text)
+        return distance if max_distance is None or distance <= max_distance else max_distance + 1
+    return _bit_parallel_distance(text, pattern, max_distance)
+
+
+def _is_sequence(value) -> bool:
+    # ~ token ID arrays come from Vocabulary.encode (array) or NumPy
+    return isinstance(value, (str, list, tuple, array)) or hasattr(value, "__array_interface__")
+
+
+def _bit_parallel_distance(text: Sequence, pattern: Sequence, max_distance: Optional[int]) -> int:
+    # ~ pattern is the shorter input; one bit per pattern position
+    match_masks = {}
+    for i, symbol in enumerate(pattern):
+        match_masks[symbol] = match_masks.get(symbol, 0) | (1 << i)
+
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    positive = mask
+    negative = 0
+    score = len(pattern)
+    remaining = len(text)
+
+    for symbol in text:
+        eq = match_masks.get(symbol, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        horizontal_pos = negative | (~(xh | positive) & mask)
+        horizontal_neg = positive & xh
+        if horizontal_pos & last:
+            score += 1
+        elif horizontal_neg & last:
+            score -= 1
+        horizontal_pos = (horizontal_pos << 1) | 1
+        horizontal_neg <<= 1
+        positive = (horizontal_neg | ~(xv | horizontal_pos)) & mask
+        negative = horizontal_pos & xv
+
+        remaining -= 1
+        # ~ each remaining symbol can lower the score by at most one
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+
+    return score if max_distance is None or score <= max_distance else max_distance + 1
+
+
+def frequency_tokens(tokens: Iterable[str], top_k: Optional[int] = None) -> List[tuple]:
+    """Return tokens sorted by frequency descending (only the ``top_k`` most frequent if given)."""
+    return Counter(tokens).most_common(top_k)
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Translate an ``n_jobs`` argument into a worker count (``-1`` means all cores)."""
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise InvalidInputError("n_jobs must be a non-zero integer")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def split_evenly(items: Sequence[T], parts: int) -> List[Sequence[T]]:
+    """Split a sequence into at most ``parts`` contiguous, non-empty slices."""
+    size = -(-len(items) // parts) if parts > 0 else len(items)
+    return [items[i : i + size] for i in range(0, len(items), size)] if size else []
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most ``size`` items from any iterable."""
+    if size <= 0:
+        raise InvalidInputError("chunk size must be positive")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_pool(max_workers: int, initializer: Optional[Callable] = None, initargs: tuple = ()):
+    """Return a ``ProcessPoolExecutor``; multiprocessing is only imported once a pool is needed."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+
+def imap_bounded(
+    func: Callable,
+    items: Iterable,
+    n_jobs: Optional[int] = 1,
+    max_pending: Optional[int] = None,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+    ordered: bool = True,
+) -> Iterator:
+    """Lazily map ``func`` over ``items`` on a process pool.
+
+    Unlike ``Executor.map`` the input is consumed incrementally: at most
+    ``max_pending`` tasks (default ``2 * workers``) are in flight, so memory
+    stays bounded on unbounded streams. Results come in input order unless
+    ``ordered=False``, which yields them as they complete so one slow task
+    does not stall the others. ``n_jobs=1`` runs in-process and ignores
+    ``initializer``, which otherwise runs once in every worker.
+    """
+    workers = resolve_n_jobs(n_jobs)
+    if workers == 1:
+        for item in items:
+            yield func(item)
+        return
+    max_pending = max_pending or 2 * workers
+    with process_pool(workers, initializer, initargs) as pool:
+        if not ordered:
+            from concurrent.futures import FIRST_COMPLETED, wait
+
+            running = set()
+            for item in items:
+                running.add(pool.submit(func, item))
+                if len(running) >= max_pending:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            return
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
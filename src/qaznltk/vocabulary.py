@@ -0,0 +1,102 @@
+"""Token interning: map tokens to dense integer IDs stored in ``array('I')`` sequences."""
+
+from __future__ import annotations
+
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .exceptions import InvalidInputError
+
+
+class _Ids(dict):
+    # ~ unseen tokens get the next free ID on lookup, so encoding hits stay in C
+    def __missing__(self, token: str) -> int:
+        value = self[token] = len(self)
+        return value
+
+
+def _unknown_id(token: str) -> int:
+    return Vocabulary.UNKNOWN_BASE | (zlib.crc32(token.encode("utf-8")) & 0x7FFFFFFF)
+
+
+class Vocabulary:
+    """Shared ``token <-> ID`` table; IDs are assigned densely in first-seen order.
+
+    Encoded sequences are ``array('I')`` (4 bytes per token) and can be
+    passed to ``calc_wer``, ``levenshtein_distance``, ``bleu_score``,
+    ``BleuAccumulator``, ``sentence_bleu_batch`` and ``QazNLTKVectorizer``
+    instead of strings. Sequences are only comparable when encoded with the
+    same vocabulary.
+
+    With ``add=False`` a token outside the vocabulary gets an ID of at least
+    ``UNKNOWN_BASE`` derived from its CRC32. The same unknown word gets the
+    same ID in every call, and different unknown words only share one on a
+    31-bit hash collision. As a result ``calc_wer`` and ``bleu_score`` do not
+    count two different out-of-vocabulary words as a match.
+    """
+
+    # ~ IDs from UNKNOWN_BASE up are reserved for tokens outside a frozen vocabulary (encode with add=False)
+    UNKNOWN_BASE = 0x80000000
+
+    def __init__(self, tokens: Iterable[str] = ()):
+        self._ids: Dict[str, int] = _Ids()
+        self._tokens: List[str] = []
+        for token in tokens:
+            self._ids[token]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._ids
+
+    def __getitem__(self, token: str) -> int:
+        """Return the ID of ``token``, adding it if it is new."""
+        return self._ids[token]
+
+    def get(self, token: str, default: Optional[int] = None) -> Optional[int]:
+        return self._ids.get(token, default)
+
+    def encode(self, tokens: Iterable[str], add: bool = True) -> array:
+        """Encode a token stream; with ``add=False`` unseen tokens get hashed IDs (see ``is_unknown``)."""
+        if isinstance(tokens, str):
+            raise InvalidInputError("encode expects an iterable of tokens, not a string")
+        ids = self._ids
+        if add:
+            return array("I", map(ids.__getitem__, tokens))
+        return array("I", [ids[token] if token in ids else _unknown_id(token) for token in tokens])
+
+    @classmethod
+    def is_unknown(cls, token_id: int) -> bool:
+        """Return whether ``token_id`` was given to a token outside the vocabulary."""
+        return token_id >= cls.UNKNOWN_BASE
+
+    def encode_batch(self, documents: Iterable[Iterable[str]], add: bool = True) -> List[array]:
+        return [self.encode(tokens, add) for tokens in documents]
+
+    def token(self, token_id: int) -> str:
+        tokens = self.__tokens()
+        if not 0 <= token_id < len(tokens):
+            raise InvalidInputError(f"unknown token ID {token_id}")
+        return tokens[token_id]
+
+    def decode(self, ids: Sequence[int]) -> List[str]:
+        tokens = self.__tokens()
+        try:
+            return [tokens[token_id] for token_id in ids]
+        except IndexError:
+            raise InvalidInputError("sequence contains IDs outside this vocabulary") from None
+
+    def __tokens(self) -> List[str]:
+        # ~ the reverse table is only rebuilt when tokens were added since the last decode
+        if len(self._tokens) != len(self._ids):
+            self._tokens = list(self._ids)
+        return self._tokens
+
+    def __getstate__(self) -> dict:
+        return {"tokens": list(self._ids)}
+
+    def __setstate__(self, state: dict) -> None:
+        self._ids = _Ids((token, i) for i, token in enumerate(state["tokens"]))
+        self._tokens = []